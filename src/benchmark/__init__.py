@@ -0,0 +1,4 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
@@ -0,0 +1,97 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import datetime
+import random
+from dataclasses import dataclass
+from typing import Iterator, Tuple
+
+from entity.availability import Availability, PERIODS
+from entity.division import Division
+from entity.match import Match
+
+WEEK_DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+SLOT_FIELDS = ('morning', 'afternoon', 'evening')
+CITIES = ['New York', 'Raleigh', 'Atlanta', 'Austin', 'Denver', 'Seattle']
+COURTS = ['Court A', 'Court B', 'Court C', 'Court D']
+# rough bounding box of the continental united states
+LATITUDES = (30.0, 47.0)
+LONGITUDES = (-122.0, -75.0)
+
+
+@dataclass(frozen=True)
+class LeagueSpec:
+    teams: int = 1000
+    # relative weights of beginner, intermediate and advanced teams
+    division_mix: Tuple[float, float, float] = (1.0, 1.0, 1.0)
+    clusters: int = 6
+    # standard deviation, in degrees, of players around their cluster centre
+    cluster_spread: float = 0.25
+    # chance that a team is available in each of the 21 slots of the week
+    availability_density: float = 0.15
+    # past matches per team, on average
+    history_length: int = 4
+    seed: int = 0
+
+
+class LeagueGenerator:
+    # produces records shaped like sample.input_data and past matches for the
+    # same teams; the same spec always produces the same league
+
+    def __init__(self, spec: LeagueSpec, season_start: datetime.date = None):
+        self._spec = spec
+        if season_start is None:
+            season_start = datetime.date(datetime.date.today().year, 8, 21)
+        self._season_start = season_start - datetime.timedelta(days=season_start.weekday())
+        self._divisions = [division.name.capitalize() for division in Division]
+
+    @property
+    def spec(self) -> LeagueSpec:
+        return self._spec
+
+    @staticmethod
+    def get_team_id(index: int) -> str:
+        return f'team{index:07d}'
+
+    def iter_records(self) -> Iterator[dict]:
+        spec = self._spec
+        rng = random.Random(spec.seed)
+        centres = [(rng.uniform(*LATITUDES), rng.uniform(*LONGITUDES)) for _ in range(spec.clusters)]
+        labels = [self._get_label(day) for day in range(len(WEEK_DAYS))]
+        for index in range(spec.teams):
+            latitude, longitude = rng.choice(centres)
+            record = {
+                'team_id': LeagueGenerator.get_team_id(index),
+                'player1_id': f'player{2 * index:07d}',
+                'player2_id': f'player{2 * index + 1:07d}',
+                'player1_coords': LeagueGenerator._get_coordinates(rng, latitude, longitude, spec.cluster_spread),
+                'player2_coords': LeagueGenerator._get_coordinates(rng, latitude, longitude, spec.cluster_spread),
+                'city': rng.choice(CITIES),
+                'division': rng.choices(self._divisions, spec.division_mix)[0],
+                'Home Court': rng.choice(COURTS),
+            }
+            for field in SLOT_FIELDS:
+                record[field] = {label for label in labels if rng.random() < spec.availability_density}
+            yield record
+
+    def iter_history(self) -> Iterator[Match]:
+        spec = self._spec
+        rng = random.Random(spec.seed + 1)
+        matches = spec.teams * spec.history_length // 2
+        if spec.teams < 2:
+            return
+        for index in range(matches):
+            team_a, team_b = rng.sample(range(spec.teams), 2)
+            date = self._season_start - datetime.timedelta(days=rng.randrange(1, 365))
+            availability = Availability.from_slots([(date, rng.randrange(PERIODS))])
+            yield Match(f'past{index:08d}', availability,
+                        (LeagueGenerator.get_team_id(team_a), LeagueGenerator.get_team_id(team_b)))
+
+    def _get_label(self, day: int) -> str:
+        date = self._season_start + datetime.timedelta(days=day)
+        return f'{WEEK_DAYS[date.weekday()]} {date.month}/{date.day}'
+
+    @staticmethod
+    def _get_coordinates(rng: random.Random, latitude: float, longitude: float, spread: float) -> Tuple[str, str]:
+        return f'{rng.gauss(latitude, spread):.6f}', f'{rng.gauss(longitude, spread):.6f}'
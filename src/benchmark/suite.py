@@ -0,0 +1,149 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import dataclasses
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from itertools import islice, product
+from typing import Dict, Iterable, Iterator, List, TextIO
+
+from benchmark.league import LeagueGenerator, LeagueSpec
+from database.team import TeamDatabaseImpl
+from entity.division import Division
+from entity.team import Team
+from interactor.matchmaking.component import AvailabilityComponents
+from interactor.matchmaking.graph import MatchmakingGraph
+from interactor.matchmaking.result import MatchMakingResult
+from interactor.matchmaking.solver import MatchmakingSolver
+from interactor.matchmaking.solver.blossom import BlossomMatchmakingSolver
+from interactor.matchmaking.solver.greedy import GreedyMatchmakingSolver
+from interactor.matchmaking.team import MatchmakingTeam
+from interactor.team.impl import TeamInteractorImpl
+
+PHASES = ('create_teams', 'build_edges', 'solve', 'save_matches')
+SOLVERS = {
+    'greedy': GreedyMatchmakingSolver,
+    'blossom': BlossomMatchmakingSolver,
+}
+TEAM_COUNTS = (100, 1000, 10000)
+# at a fixed availability density the edge count of a league grows with the
+# square of its team count, so larger tiers are run as regional leagues of at
+# most this many teams, matched one after the other, as a real deployment would
+# split them; a region averages about 130 opponents per team
+MAX_REGION_TEAMS = 1000
+MAX_VARIANT_TEAMS = 1000
+HISTORY_CHUNK_SIZE = 10000
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    spec: LeagueSpec
+    solver: str
+    seconds: Dict[str, float]
+    teams: int
+    regions: int
+    teams_without_slots: int
+    past_matches: int
+    edges: int
+    matchups: int
+    byes: int
+
+    def to_dict(self) -> dict:
+        return dataclasses.asdict(self)
+
+
+class BenchmarkSuite:
+    # every phase of a run is timed on its own against a fresh temporary
+    # database; generating the league and seeding its history are not timed
+
+    def __init__(self, solver: str = 'greedy', region_teams: int = MAX_REGION_TEAMS):
+        self._solver_name = solver
+        self._solver: MatchmakingSolver = SOLVERS[solver]()
+        self._region_teams = region_teams
+
+    def run(self, spec: LeagueSpec) -> BenchmarkResult:
+        generator = LeagueGenerator(spec)
+        seconds = dict.fromkeys(PHASES, 0.0)
+        with tempfile.TemporaryDirectory() as directory:
+            db = TeamDatabaseImpl(os.path.join(directory, 'team.db'))
+            with db:
+                past_matches = BenchmarkSuite._seed_history(db, generator)
+                records = list(generator.iter_records())
+                interactor = TeamInteractorImpl()
+                interactor.set_db(db)
+
+                start = time.perf_counter()
+                teams = list(interactor.iter_teams(records))
+                seconds['create_teams'] = time.perf_counter() - start
+                del records
+
+                edges = 0
+                results: List[MatchMakingResult] = list()
+                regions = BenchmarkSuite._get_regions(teams, self._region_teams)
+                for region, division in product(regions, Division):
+                    division_teams = [team for team in region if team.division == division]
+                    for component in AvailabilityComponents(division_teams).split():
+                        start = time.perf_counter()
+                        graph = MatchmakingGraph([MatchmakingTeam(team) for team in component])
+                        seconds['build_edges'] += time.perf_counter() - start
+                        edges += len(graph)
+                        start = time.perf_counter()
+                        results.append(self._solver.solve(graph))
+                        seconds['solve'] += time.perf_counter() - start
+                result = MatchMakingResult.merge(results)
+
+                start = time.perf_counter()
+                interactor.save_matchups(list(result.matchups))
+                seconds['save_matches'] = time.perf_counter() - start
+        teams_without_slots = sum(1 for team in teams if not team.availability.mask)
+        return BenchmarkResult(spec, self._solver_name, seconds, len(teams), len(regions), teams_without_slots,
+                               past_matches, edges, len(result.matchups), result.byes)
+
+    def run_all(self, specs: Iterable[LeagueSpec]) -> Iterator[BenchmarkResult]:
+        for spec in specs:
+            yield self.run(spec)
+
+    @staticmethod
+    def _get_regions(teams: List[Team], region_teams: int) -> List[List[Team]]:
+        regions = max(1, -(-len(teams) // region_teams))
+        return [teams[index * len(teams) // regions:(index + 1) * len(teams) // regions] for index in range(regions)]
+
+    @staticmethod
+    def _seed_history(db: TeamDatabaseImpl, generator: LeagueGenerator) -> int:
+        seeded = 0
+        history = generator.iter_history()
+        while True:
+            matches = list(islice(history, HISTORY_CHUNK_SIZE))
+            if not matches:
+                return seeded
+            seeded += db.save_matches(matches).matches
+
+
+def get_default_specs(team_counts: Iterable[int] = TEAM_COUNTS, seed: int = 0) -> List[LeagueSpec]:
+    # team count is scaled on its own, every other dimension is varied around
+    # the smallest league that is still large enough to show a trend, but no
+    # larger than one the densest variant can still be built for
+    team_counts = sorted(team_counts)
+    specs = [LeagueSpec(teams=teams, seed=seed) for teams in team_counts]
+    base = LeagueSpec(teams=min(team_counts[min(1, len(team_counts) - 1)], MAX_VARIANT_TEAMS), seed=seed)
+    specs.extend([
+        dataclasses.replace(base, division_mix=(6.0, 3.0, 1.0)),
+        dataclasses.replace(base, clusters=1, cluster_spread=0.05),
+        dataclasses.replace(base, clusters=50, cluster_spread=2.0),
+        dataclasses.replace(base, availability_density=0.05),
+        dataclasses.replace(base, availability_density=0.4),
+        dataclasses.replace(base, history_length=0),
+        dataclasses.replace(base, history_length=32),
+    ])
+    return specs
+
+
+def write_results(results: Iterable[BenchmarkResult], output: TextIO):
+    for result in results:
+        output.write(json.dumps(result.to_dict()) + '\n')
+        output.flush()
+
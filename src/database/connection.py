@@ -0,0 +1,75 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import itertools
+import sqlite3
+import threading
+from typing import Dict, List
+
+MEMORY = ':memory:'
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+}
+
+_memory_databases = itertools.count()
+
+
+class ConnectionManager:
+
+    def __init__(self, db_file_path: str, pragmas: Dict[str, str] = None):
+        self._db_file_path = db_file_path
+        self._pragmas = DEFAULT_PRAGMAS if pragmas is None else pragmas
+        self._uri = self._get_uri(db_file_path)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = list()
+        self._generation = 0
+        self._depth = 0
+
+    @property
+    def db_file_path(self) -> str:
+        return self._db_file_path
+
+    @staticmethod
+    def _get_uri(db_file_path: str) -> 'str | None':
+        # every thread gets its own connection, so in-memory databases go
+        # through a named shared cache to stay visible across threads
+        if db_file_path == MEMORY:
+            return f'file:team-{next(_memory_databases)}?mode=memory&cache=shared'
+        return None
+
+    def get_connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None and self._local.generation == self._generation:
+            return conn
+        if self._uri is not None:
+            conn = sqlite3.connect(self._uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self._db_file_path, check_same_thread=False)
+        for name, value in self._pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        with self._lock:
+            self._connections.append(conn)
+            self._local.connection = conn
+            self._local.generation = self._generation
+        return conn
+
+    def close(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._generation += 1
+
+    def __enter__(self) -> 'ConnectionManager':
+        self._depth += 1
+        self.get_connection()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._depth -= 1
+        if self._depth == 0:
+            self.close()
@@ -0,0 +1,86 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import os
+import sqlite3
+from typing import Dict, Iterable
+
+from database.connection import ConnectionManager
+from instrumentation.metrics import metrics
+from interactor.matchmaking import DistanceDatabase, PlayerPairKey
+
+
+class DistanceDatabaseImpl(DistanceDatabase):
+
+    def __init__(self, db_file_path: str = None):
+        self._db_file_path = db_file_path or self._get_db_file_path()
+        self._connections = ConnectionManager(self._db_file_path)
+        self._created = False
+
+    def __enter__(self) -> 'DistanceDatabaseImpl':
+        self._connections.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._connections.__exit__(exc_type, exc_val, exc_tb)
+
+    def __reduce__(self):
+        # worker processes reopen the same file instead of sharing connections
+        return DistanceDatabaseImpl, (self._db_file_path,)
+
+    @staticmethod
+    def _get_db_file_path() -> str:
+        module_path = os.path.dirname(os.path.abspath(__file__))
+        return os.path.join(module_path, 'distance.db')
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = self._connections.get_connection()
+        conn.set_trace_callback(metrics.count_sql_statement if metrics.enabled else None)
+        if not self._created:
+            with conn:
+                conn.execute('CREATE TABLE IF NOT EXISTS "distance" ('
+                             '"player_a" TEXT NOT NULL, '
+                             '"player_b" TEXT NOT NULL, '
+                             '"latitude_a" REAL NOT NULL, '
+                             '"longitude_a" REAL NOT NULL, '
+                             '"latitude_b" REAL NOT NULL, '
+                             '"longitude_b" REAL NOT NULL, '
+                             '"miles" REAL NOT NULL, '
+                             'PRIMARY KEY("player_a", "player_b")) WITHOUT ROWID')
+            self._created = True
+        return conn
+
+    def get_distances(self, keys: Iterable[PlayerPairKey]) -> Dict[PlayerPairKey, float]:
+        requested = {(a[0], b[0]): (a, b) for a, b in keys}
+        distances = dict()
+        if not requested:
+            return distances
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.cursor()
+            # kept on the pooled connection, so it is emptied rather than
+            # created fresh in case an earlier lookup failed halfway
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS requested_distance (player_a TEXT, player_b TEXT, "
+                           "PRIMARY KEY (player_a, player_b))")
+            cursor.execute("DELETE FROM requested_distance")
+            cursor.executemany("INSERT INTO requested_distance (player_a, player_b) VALUES (?, ?)", requested)
+            cursor.execute("SELECT d.player_a, d.player_b, d.latitude_a, d.longitude_a, d.latitude_b, d.longitude_b, "
+                           "d.miles FROM requested_distance r CROSS JOIN distance d "
+                           "ON d.player_a = r.player_a AND d.player_b = r.player_b")
+            for player_a, player_b, latitude_a, longitude_a, latitude_b, longitude_b, miles in cursor.fetchall():
+                key = requested[(player_a, player_b)]
+                # a player who moved keeps the id but not the coordinates, so
+                # the stored distance is stale and is left to be recomputed
+                if key == ((player_a, latitude_a, longitude_a), (player_b, latitude_b, longitude_b)):
+                    distances[key] = miles
+            cursor.execute("DELETE FROM requested_distance")
+            cursor.close()
+        return distances
+
+    def save_distances(self, distances: Dict[PlayerPairKey, float]):
+        rows = [(a[0], b[0], a[1], a[2], b[1], b[2], miles) for (a, b), miles in distances.items()]
+        conn = self._get_connection()
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO distance (player_a, player_b, latitude_a, longitude_a, "
+                             "latitude_b, longitude_b, miles) VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
@@ -0,0 +1,65 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import sqlite3
+from typing import List
+
+# every entry upgrades the schema by one version, which sqlite keeps in the
+# user_version pragma; statements must be safe on databases created before
+# versioning existed
+MIGRATIONS: List[List[str]] = [
+    [
+        'CREATE TABLE IF NOT EXISTS "match" ('
+        '"id" TEXT NOT NULL, '
+        '"team_a" TEXT NOT NULL, '
+        '"team_b" TEXT NOT NULL, '
+        'PRIMARY KEY("id"))',
+        'CREATE TABLE IF NOT EXISTS "availability" ('
+        '"id" INTEGER NOT NULL, '
+        '"date" TEXT NOT NULL, '
+        '"match" TEXT NOT NULL REFERENCES "match"("id"), '
+        '"period" INTEGER NOT NULL, '
+        'PRIMARY KEY("id" AUTOINCREMENT))',
+    ],
+    [
+        'CREATE INDEX IF NOT EXISTS "match_team_a" ON "match" ("team_a", "id", "team_b")',
+        'CREATE INDEX IF NOT EXISTS "match_team_b" ON "match" ("team_b", "id", "team_a")',
+        'CREATE INDEX IF NOT EXISTS "availability_match" ON "availability" ("match", "date", "period")',
+        'ANALYZE',
+    ],
+]
+
+
+class Schema:
+
+    @staticmethod
+    def get_version(conn: sqlite3.Connection) -> int:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+
+    @staticmethod
+    def get_latest_version() -> int:
+        return len(MIGRATIONS)
+
+    @staticmethod
+    def migrate(conn: sqlite3.Connection) -> int:
+        # a current schema needs neither the write lock nor a write; the
+        # version is read again under the lock in case another process
+        # migrated in between
+        version = Schema.get_version(conn)
+        if version >= Schema.get_latest_version():
+            return version
+        conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = Schema.get_version(conn)
+            for statements in MIGRATIONS[version:]:
+                for statement in statements:
+                    conn.execute(statement)
+            latest_version = max(version, Schema.get_latest_version())
+            conn.execute(f"PRAGMA user_version = {latest_version}")
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return latest_version
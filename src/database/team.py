@@ -5,67 +5,132 @@ date: 8/23/23
 import datetime
 import os
 import sqlite3
-from typing import List
+import sys
+import time
+from collections import defaultdict
+from itertools import groupby
+from typing import List, Dict, Iterable, Iterator
 
+from database.connection import ConnectionManager
+from database.schema import Schema
 from entity.availability import Availability
 from entity.match import Match
+from instrumentation.metrics import metrics
 from interactor.team import TeamDatabase
+from interactor.team.result import SaveMatchesResult
 
 
 class TeamDatabaseImpl(TeamDatabase):
 
-    def __init__(self):
-        self._db_file_path = self._get_db_file_path()
+    def __init__(self, db_file_path: str = None, connections: ConnectionManager = None):
+        if connections is None:
+            connections = ConnectionManager(db_file_path or self._get_db_file_path())
+        self._connections = connections
+        self._migrated = False
+
+    def __enter__(self) -> 'TeamDatabaseImpl':
+        self._connections.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._connections.__exit__(exc_type, exc_val, exc_tb)
 
     @staticmethod
     def _get_db_file_path() -> str:
         module_path = os.path.dirname(os.path.abspath(__file__))
         return os.path.join(module_path, 'team.db')
 
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = self._connections.get_connection()
+        conn.set_trace_callback(metrics.count_sql_statement if metrics.enabled else None)
+        if not self._migrated:
+            Schema.migrate(conn)
+            self._migrated = True
+        return conn
+
+    def migrate(self) -> int:
+        return Schema.get_version(self._get_connection())
+
     def get_past_matches(self, team_id: str) -> List[Match]:
-        past_matches = list()
-        conn = sqlite3.connect(self._db_file_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, team_a, team_b FROM match WHERE team_a = ? OR team_b = ?", (team_id, team_id))
-        for match_row in cursor.fetchall():
-            morning_dates = set()
-            afternoon_dates = set()
-            evening_dates = set()
-            match_id, team_a, team_b = match_row
-            cursor.execute("SELECT date, period FROM availability WHERE match = ?", (match_id,))
-            for availability_row in cursor.fetchall():
-                date_text, period = availability_row
-                date = datetime.date.fromisoformat(date_text)
-                if period == 0:
-                    morning_dates.add(date)
-                elif period == 1:
-                    afternoon_dates.add(date)
-                elif period == 2:
-                    evening_dates.add(date)
-            availability = Availability(morning_dates, afternoon_dates, evening_dates)
-            match = Match(match_id, availability, (team_a, team_b))
-            past_matches.append(match)
-        cursor.close()
-        conn.close()
+        return self.get_past_matches_for_teams([team_id])[team_id]
+
+    def get_past_matches_for_teams(self, team_ids: Iterable[str]) -> Dict[str, List[Match]]:
+        past_matches = {team_id: list() for team_id in team_ids}
+        availabilities: Dict[Availability, Availability] = dict()
+        availabilities_by_slots: Dict[tuple, Availability] = dict()
+        conn = self._get_connection()
+        with metrics.phase('load_history'), conn:
+            cursor = conn.cursor()
+            # the temp tables live as long as the pooled connection, so a load
+            # that failed halfway must not leave rows behind for the next one
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS requested_team (id TEXT PRIMARY KEY)")
+            cursor.execute("CREATE TEMP TABLE IF NOT EXISTS requested_match (id TEXT PRIMARY KEY)")
+            cursor.execute("DELETE FROM requested_team")
+            cursor.execute("DELETE FROM requested_match")
+            cursor.executemany("INSERT INTO requested_team (id) VALUES (?)", ((team_id,) for team_id in past_matches))
+            cursor.execute("INSERT INTO requested_match (id) "
+                           "SELECT id FROM match WHERE team_a IN requested_team "
+                           "UNION SELECT id FROM match WHERE team_b IN requested_team")
+            slots = defaultdict(list)
+            # the temp tables have no statistics, so CROSS JOIN keeps sqlite
+            # from scanning the whole history instead of probing the indexes
+            cursor.execute("SELECT a.match, a.date, a.period "
+                           "FROM requested_match r CROSS JOIN availability a ON a.match = r.id")
+            for match_id, date_text, period in cursor.fetchall():
+                if period in (0, 1, 2):
+                    slots[match_id].append((date_text, period))
+            cursor.execute("SELECT m.id, m.team_a, m.team_b FROM requested_match r CROSS JOIN match m ON m.id = r.id")
+            for match_id, team_a, team_b in cursor.fetchall():
+                # histories repeat a few availabilities many times, so each
+                # distinct set of slot rows is only parsed once
+                match_slots = tuple(slots[match_id])
+                availability = availabilities_by_slots.get(match_slots)
+                if availability is None:
+                    availability = Availability.from_slots(
+                        (datetime.date.fromisoformat(date_text), period) for date_text, period in match_slots)
+                    availability = availabilities.setdefault(availability, availability)
+                    availabilities_by_slots[match_slots] = availability
+                contestants = (sys.intern(team_a), sys.intern(team_b))
+                match = Match(sys.intern(match_id), availability, contestants)
+                if team_a in past_matches:
+                    past_matches[team_a].append(match)
+                if team_b in past_matches and team_b != team_a:
+                    past_matches[team_b].append(match)
+            cursor.execute("DELETE FROM requested_match")
+            cursor.execute("DELETE FROM requested_team")
+            cursor.close()
         return past_matches
 
-    def save_matches(self, matches: List[Match]):
-        conn = sqlite3.connect(self._db_file_path)
-        cursor = conn.cursor()
+    def save_matches(self, matches: List[Match]) -> SaveMatchesResult:
+        start = time.perf_counter()
+        match_rows = list()
+        availability_rows = list()
         for match in matches:
-            match_id = match.id
             team_a, team_b = match.contestants
-            cursor.execute("INSERT INTO match (id, team_a, team_b) VALUES (?, ?, ?)", (match_id, team_a, team_b))
-        conn.commit()
-        for match in matches:
-            availability = match.availability
-            insert_query = "INSERT INTO availability (date, match, period) VALUES (?, ?, ?)"
-            for date in availability.morning:
-                cursor.execute(insert_query, (date.isoformat(), match.id, 0))
-            for date in availability.afternoon:
-                cursor.execute(insert_query, (date.isoformat(), match.id, 1))
-            for date in availability.evening:
-                cursor.execute(insert_query, (date.isoformat(), match.id, 2))
-        conn.commit()
-        cursor.close()
-        conn.close()
+            match_rows.append((match.id, team_a, team_b))
+            for date, period in match.availability.slots():
+                availability_rows.append((date.isoformat(), match.id, period))
+        conn = self._get_connection()
+        with metrics.phase('save_matches'), conn:
+            conn.executemany("INSERT INTO match (id, team_a, team_b) VALUES (?, ?, ?)", match_rows)
+            conn.executemany("INSERT INTO availability (date, match, period) VALUES (?, ?, ?)", availability_rows)
+        return SaveMatchesResult(len(match_rows), len(availability_rows), time.perf_counter() - start)
+
+    def backup(self, db_file_path: str):
+        target = sqlite3.connect(db_file_path)
+        try:
+            self._get_connection().backup(target)
+        finally:
+            target.close()
+
+    def iter_matches(self) -> Iterator[Match]:
+        conn = self._get_connection()
+        cursor = conn.execute("SELECT m.id, m.team_a, m.team_b, a.date, a.period FROM match m "
+                              "LEFT JOIN availability a ON a.match = m.id ORDER BY m.id")
+        try:
+            for (match_id, team_a, team_b), rows in groupby(cursor, key=lambda row: row[:3]):
+                slots = [(datetime.date.fromisoformat(date_text), period) for _, _, _, date_text, period in rows
+                         if date_text is not None and period in (0, 1, 2)]
+                yield Match(match_id, Availability.from_slots(slots), (team_a, team_b))
+        finally:
+            cursor.close()
@@ -3,34 +3,104 @@ author: oluiscabral
 date: 8/23/23
 """
 import datetime
-from dataclasses import dataclass
-from typing import Set
+from dataclasses import dataclass, field
+from typing import Set, Iterator, Iterable, Tuple
 
+PERIODS = 3
+EMPTY_EPOCH = datetime.date.min
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Availability:
-    morning: Set[datetime.date]
-    afternoon: Set[datetime.date]
-    evening: Set[datetime.date]
+    # bit (days since epoch) * PERIODS + period is set for every available slot;
+    # the epoch is the monday of the first available week, so equal
+    # availabilities always share the same mask and epoch
+    mask: int
+    epoch: datetime.date
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        mask, epoch = Availability._normalize(self.mask, self.epoch)
+        object.__setattr__(self, 'mask', mask)
+        object.__setattr__(self, 'epoch', epoch)
+        object.__setattr__(self, '_hash', hash((mask, epoch)))
+
+    @staticmethod
+    def _normalize(mask: int, epoch: datetime.date) -> Tuple[int, datetime.date]:
+        if mask == 0:
+            return 0, EMPTY_EPOCH
+        first_date = epoch + datetime.timedelta(days=((mask & -mask).bit_length() - 1) // PERIODS)
+        first_monday = first_date - datetime.timedelta(days=first_date.weekday())
+        shift = (first_monday - epoch).days * PERIODS
+        if shift > 0:
+            return mask >> shift, first_monday
+        return mask << -shift, first_monday
+
+    @classmethod
+    def from_slots(cls, slots: Iterable[Tuple[datetime.date, int]]) -> 'Availability':
+        slots = list(slots)
+        if not slots:
+            return cls(0, EMPTY_EPOCH)
+        epoch = min(date for date, _ in slots)
+        mask = 0
+        for date, period in slots:
+            mask |= 1 << ((date - epoch).days * PERIODS + period)
+        return cls(mask, epoch)
+
+    @classmethod
+    def from_dates(cls, morning: Iterable[datetime.date], afternoon: Iterable[datetime.date],
+                   evening: Iterable[datetime.date]) -> 'Availability':
+        slots = [(date, 0) for date in morning]
+        slots.extend((date, 1) for date in afternoon)
+        slots.extend((date, 2) for date in evening)
+        return cls.from_slots(slots)
+
+    @property
+    def morning(self) -> Set[datetime.date]:
+        return self._get_dates(0)
+
+    @property
+    def afternoon(self) -> Set[datetime.date]:
+        return self._get_dates(1)
+
+    @property
+    def evening(self) -> Set[datetime.date]:
+        return self._get_dates(2)
 
     def __hash__(self):
-        value = 0
-        for date in self.morning.union(self.afternoon).union(self.evening):
-            value += hash(date)
-        return value
+        return self._hash
 
-    def meets(self, other: 'Availability') -> bool:
-        return (self._meets(self.morning, other.morning)
-                or self._meets(self.afternoon, other.afternoon)
-                or self._meets(self.evening, other.evening))
+    def _get_dates(self, period: int) -> Set[datetime.date]:
+        return {date for date, slot_period in self.slots() if slot_period == period}
 
-    @staticmethod
-    def _meets(a, b):
-        intersection = a.intersection(b)
-        return len(intersection) > 0
+    def slots(self) -> Iterator[Tuple[datetime.date, int]]:
+        for index in self.slot_indexes():
+            yield self.epoch + datetime.timedelta(days=index // PERIODS), index % PERIODS
+
+    def slot_indexes(self) -> Iterator[int]:
+        # ascending, so slots come out by date and then period; the epoch is
+        # a monday, so index % (7 * PERIODS) identifies the slot of the week
+        mask = self.mask
+        while mask:
+            low_bit = mask & -mask
+            yield low_bit.bit_length() - 1
+            mask ^= low_bit
+
+    def meets(self, other: 'Availability') -> bool:
+        if self.epoch == other.epoch:
+            return self.mask & other.mask != 0
+        mask, other_mask, _ = self._align(other)
+        return mask & other_mask != 0
 
     def get_intersection(self, other: 'Availability') -> 'Availability':
-        morning_intersection = self.morning.intersection(other.morning)
-        afternoon_intersection = self.afternoon.intersection(other.afternoon)
-        evening_intersection = self.evening.intersection(other.evening)
-        return Availability(morning_intersection, afternoon_intersection, evening_intersection)
+        if self.epoch == other.epoch:
+            return Availability(self.mask & other.mask, self.epoch)
+        mask, other_mask, epoch = self._align(other)
+        return Availability(mask & other_mask, epoch)
+
+    def _align(self, other: 'Availability') -> Tuple[int, int, datetime.date]:
+        if self.mask == 0 or other.mask == 0:
+            return 0, 0, EMPTY_EPOCH
+        if self.epoch < other.epoch:
+            return self.mask, other.mask << (other.epoch - self.epoch).days * PERIODS, self.epoch
+        return self.mask << (self.epoch - other.epoch).days * PERIODS, other.mask, other.epoch
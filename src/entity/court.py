@@ -5,6 +5,6 @@ date: 8/23/23
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Court:
     name: str
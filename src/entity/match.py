@@ -8,7 +8,7 @@ from typing import Tuple
 from entity.availability import Availability
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Match:
     id: str
     availability: Availability
@@ -9,7 +9,7 @@ from entity.availability import Availability
 from entity.team import Team
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Matchup:
     availability: Availability
     contestants: Tuple[Team, Team]
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Player:
     id: str
     coordinates: Tuple[str, str]
@@ -3,7 +3,7 @@ author: oluiscabral
 date: 8/23/23
 """
 from dataclasses import dataclass
-from typing import List
+from typing import Tuple, Dict
 
 from entity.availability import Availability
 from entity.city import City
@@ -13,14 +13,15 @@ from entity.match import Match
 from entity.player import Player
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Team:
     id: str
     city: City
     home_court: Court
     division: Division
-    players: List[Player]
-    past_matches: List[Match]
+    players: Tuple[Player, ...]
+    past_matches: Tuple[Match, ...]
+    past_opponents: Dict[str, int]
     availability: Availability
 
     def __hash__(self):
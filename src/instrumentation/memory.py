@@ -0,0 +1,107 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List
+
+TOP_SITES = 10
+TRACEBACK_FRAMES = 1
+IGNORED_FILES = (tracemalloc.__file__, '<frozen importlib._bootstrap>', '<frozen importlib._bootstrap_external>',
+                 '<unknown>')
+
+
+@dataclass(frozen=True)
+class AllocationSite:
+    location: str
+    size: int
+    count: int
+
+
+@dataclass
+class PhaseMemory:
+    name: str
+    # bytes still allocated when the phase ends, relative to its start
+    retained: int
+    # highest allocation reached during the phase, relative to its start
+    peak: int
+    top_sites: List[AllocationSite]
+    unit: str = None
+    units: int = 0
+
+    @property
+    def bytes_per_unit(self) -> 'float | None':
+        if not self.units:
+            return None
+        return self.retained / self.units
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        if self.unit is not None:
+            data[f'bytes_per_{self.unit}'] = self.bytes_per_unit
+        return data
+
+
+class MemoryProfiler:
+    # snapshots are taken around every phase, so the profiler is meant for
+    # dedicated runs: tracing slows allocation-heavy code down several times
+
+    def __init__(self, top_sites: int = TOP_SITES, frames: int = TRACEBACK_FRAMES):
+        self._top_sites = top_sites
+        self._frames = frames
+        self._phases: Dict[str, PhaseMemory] = dict()
+        self._started = False
+
+    def __enter__(self) -> 'MemoryProfiler':
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._frames)
+            self._started = True
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    @property
+    def phases(self) -> List[PhaseMemory]:
+        return list(self._phases.values())
+
+    def get_phase(self, name: str) -> PhaseMemory:
+        return self._phases[name]
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        before = MemoryProfiler._take_snapshot()
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        yield
+        current, peak = tracemalloc.get_traced_memory()
+        after = MemoryProfiler._take_snapshot()
+        self._phases[name] = PhaseMemory(name, current - start, peak - start, self._get_top_sites(before, after))
+
+    def set_units(self, name: str, unit: str, units: int):
+        phase = self._phases[name]
+        phase.unit = unit
+        phase.units = units
+
+    def report(self) -> dict:
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            'phases': [phase.to_dict() for phase in self._phases.values()],
+            'current': current,
+            'peak': peak,
+        }
+
+    @staticmethod
+    def _take_snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, file) for file in IGNORED_FILES])
+
+    def _get_top_sites(self, before: tracemalloc.Snapshot, after: tracemalloc.Snapshot) -> List[AllocationSite]:
+        sites = list()
+        for stat in after.compare_to(before, 'lineno')[:self._top_sites]:
+            frame = stat.traceback[0]
+            sites.append(AllocationSite(f'{frame.filename}:{frame.lineno}', stat.size_diff, stat.count_diff))
+        return sites
@@ -0,0 +1,115 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from typing import ContextManager, Dict
+
+PREFIX = 'matchmaking'
+
+_DISABLED_PHASE = nullcontext()
+
+
+class _PhaseTimer:
+    __slots__ = ('_metrics', '_name', '_start')
+
+    def __init__(self, metrics: 'Metrics', name: str):
+        self._metrics = metrics
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._metrics.add_time(self._name, time.perf_counter() - self._start)
+
+
+class Metrics:
+    # disabled by default; hot paths check `enabled` before doing any work,
+    # so leaving it off costs one attribute lookup per instrumented call.
+    # worker processes count on their own copy and send back a snapshot to
+    # merge; phase seconds then add up across processes
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._seconds: Dict[str, float] = defaultdict(float)
+        self._calls: Dict[str, int] = defaultdict(int)
+        self._counters: Dict[str, int] = defaultdict(int)
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._seconds.clear()
+            self._calls.clear()
+            self._counters.clear()
+
+    def phase(self, name: str) -> ContextManager:
+        if not self.enabled:
+            return _DISABLED_PHASE
+        return _PhaseTimer(self, name)
+
+    def add_time(self, name: str, seconds: float):
+        with self._lock:
+            self._seconds[name] += seconds
+            self._calls[name] += 1
+
+    def increment(self, name: str, amount: int = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] += amount
+
+    def merge(self, snapshot: dict):
+        with self._lock:
+            for name, phase in snapshot['phases'].items():
+                self._seconds[name] += phase['seconds']
+                self._calls[name] += phase['calls']
+            for name, value in snapshot['counters'].items():
+                self._counters[name] += value
+
+    def count_sql_statement(self, _statement: str):
+        self.increment('sql_statements')
+
+    def get_seconds(self, name: str) -> float:
+        return self._seconds.get(name, 0.0)
+
+    def get_counter(self, name: str) -> int:
+        return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            phases = {name: {'seconds': seconds, 'calls': self._calls[name]}
+                      for name, seconds in sorted(self._seconds.items())}
+            counters = dict(sorted(self._counters.items()))
+        return {'phases': phases, 'counters': counters}
+
+    def to_json(self, indent: int = None) -> str:
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self) -> str:
+        snapshot = self.snapshot()
+        lines = [f'# TYPE {PREFIX}_phase_seconds_total counter']
+        lines.extend(f'{PREFIX}_phase_seconds_total{{phase="{name}"}} {phase["seconds"]!r}'
+                     for name, phase in snapshot['phases'].items())
+        lines.append(f'# TYPE {PREFIX}_phase_calls_total counter')
+        lines.extend(f'{PREFIX}_phase_calls_total{{phase="{name}"}} {phase["calls"]}'
+                     for name, phase in snapshot['phases'].items())
+        for name, value in snapshot['counters'].items():
+            lines.append(f'# TYPE {PREFIX}_{name}_total counter')
+            lines.append(f'{PREFIX}_{name}_total {value}')
+        return '\n'.join(lines) + '\n'
+
+
+metrics = Metrics()
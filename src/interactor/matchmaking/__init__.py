@@ -3,8 +3,9 @@ author: oluiscabral
 date: 8/23/23
 """
 from abc import ABC
-from typing import Set
+from typing import Set, Dict, Iterable, Iterator, Tuple
 
+from entity.matchup import Matchup
 from entity.team import Team
 
 
@@ -12,3 +13,23 @@ class Matchmaking(ABC):
 
     def get_best_matchups(self, teams: Set[Team]):
         pass
+
+    def iter_best_matchups(self, teams: Iterable[Team]) -> Iterator[Matchup]:
+        pass
+
+    def get_best_result(self, teams: Set[Team]):
+        pass
+
+
+# an unordered player pair, each side as (player id, latitude, longitude) and
+# the smaller side first
+PlayerPairKey = Tuple[Tuple[str, float, float], Tuple[str, float, float]]
+
+
+class DistanceDatabase(ABC):
+
+    def get_distances(self, keys: Iterable[PlayerPairKey]) -> Dict[PlayerPairKey, float]:
+        pass
+
+    def save_distances(self, distances: Dict[PlayerPairKey, float]):
+        pass
@@ -0,0 +1,41 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import datetime
+from typing import List, Dict, Tuple
+
+from entity.team import Team
+
+
+class AvailabilityComponents:
+
+    def __init__(self, teams: List[Team]):
+        self._teams = teams
+        self._parents = list(range(len(teams)))
+
+    def split(self) -> List[List[Team]]:
+        # two teams of a division are connected exactly when they share a slot,
+        # so joining every team with the first team seen in each of its slots
+        # yields the connected components of the edge graph
+        first_teams: Dict[Tuple[datetime.date, int], int] = dict()
+        for index, team in enumerate(self._teams):
+            for slot in team.availability.slots():
+                self._union(index, first_teams.setdefault(slot, index))
+        components: Dict[int, List[Team]] = dict()
+        for index, team in enumerate(self._teams):
+            components.setdefault(self._find(index), list()).append(team)
+        return list(components.values())
+
+    def _find(self, index: int) -> int:
+        parents = self._parents
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    def _union(self, a: int, b: int):
+        root_a = self._find(a)
+        root_b = self._find(b)
+        if root_a != root_b:
+            self._parents[root_b] = root_a
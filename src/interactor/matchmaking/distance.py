@@ -0,0 +1,48 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+from typing import Sequence
+
+import numpy
+
+from interactor.matchmaking.team import MatchmakingTeam
+
+# haversine on the mean earth radius stays within 0.5% of the WGS-84 geodesic
+EARTH_RADIUS_MILES = 3958.7613
+PAIRS_PER_CHUNK = 1 << 20
+
+
+class DistanceMatrix:
+
+    def __init__(self, teams: Sequence[MatchmakingTeam]):
+        self._coordinates = DistanceMatrix._get_coordinates(teams)
+
+    def get_pairs(self, a_indexes: numpy.ndarray, b_indexes: numpy.ndarray) -> numpy.ndarray:
+        distances = numpy.zeros(len(a_indexes), dtype=numpy.float64)
+        players = self._coordinates.shape[1]
+        for start in range(0, len(a_indexes), PAIRS_PER_CHUNK):
+            a_coordinates = self._coordinates[a_indexes[start:start + PAIRS_PER_CHUNK]]
+            b_coordinates = self._coordinates[b_indexes[start:start + PAIRS_PER_CHUNK]]
+            chunk = distances[start:start + PAIRS_PER_CHUNK]
+            for player in range(players):
+                for opponent in range(players):
+                    chunk += DistanceMatrix._haversine(a_coordinates[:, player], b_coordinates[:, opponent])
+        return distances
+
+    @staticmethod
+    def _get_coordinates(teams: Sequence[MatchmakingTeam]) -> numpy.ndarray:
+        if not teams:
+            return numpy.empty((0, 0, 2), dtype=numpy.float64)
+        coordinates = [[player.coordinates for player in team.players] for team in teams]
+        return numpy.radians(numpy.array(coordinates, dtype=numpy.float64).reshape(len(teams), -1, 2))
+
+    @staticmethod
+    def _haversine(a: numpy.ndarray, b: numpy.ndarray) -> numpy.ndarray:
+        latitude_a = a[..., 0]
+        latitude_b = b[..., 0]
+        half_latitude = (latitude_b - latitude_a) / 2
+        half_longitude = (b[..., 1] - a[..., 1]) / 2
+        h = (numpy.sin(half_latitude) ** 2
+             + numpy.cos(latitude_a) * numpy.cos(latitude_b) * numpy.sin(half_longitude) ** 2)
+        return 2 * EARTH_RADIUS_MILES * numpy.arcsin(numpy.sqrt(numpy.minimum(h, 1.0)))
@@ -2,16 +2,18 @@
 author: oluiscabral
 date: 8/23/23
 """
-from geopy.distance import geodesic
+from instrumentation.metrics import metrics
+from interactor.matchmaking.geodesic import get_geodesic_miles
 
 
 class MatchmakingEdge:
 
-    def __init__(self, a: 'MatchMakingTeam', b: 'MatchmakingTeam'):
+    def __init__(self, a: 'MatchMakingTeam', b: 'MatchmakingTeam', distance_points: float = None,
+                 past_matches_points: int = None):
         self._a = a
         self._b = b
-        self._distance_points = None
-        self._past_matches_points = None
+        self._distance_points = distance_points
+        self._past_matches_points = past_matches_points
 
     @property
     def a(self) -> 'MatchmakingTeam':
@@ -34,18 +36,12 @@ class MatchmakingEdge:
         return self._past_matches_points
 
     def _get_distance_points(self):
+        metrics.increment('geodesic_evaluations', len(self._a.players) * len(self._b.players))
         points = 0
         for player in self._a.players:
             for opponent in self._b.players:
-                points += geodesic(player.coordinates, opponent.coordinates).mi
+                points += get_geodesic_miles(player.coordinates, opponent.coordinates)
         return points
 
     def _get_past_matches_points(self):
-        points = 0
-        for match in self._a.past_matches:
-            for contestant in match.contestants:
-                if self._a.id == contestant:
-                    continue
-                if self._b.id == contestant:
-                    points += 1
-        return points
+        return self._a.past_opponents.get(self._b.id, 0)
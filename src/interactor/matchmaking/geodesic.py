@@ -0,0 +1,96 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+import numpy
+
+from entity.player import Player
+from instrumentation.metrics import metrics
+from interactor.matchmaking import DistanceDatabase, PlayerPairKey
+
+MAX_SIZE = 1 << 18
+
+
+def get_geodesic_miles(a, b) -> float:
+    # geopy is slow to import and is not needed when every distance is cached
+    from geopy.distance import geodesic
+    return geodesic(a, b).mi
+
+
+class GeodesicCache:
+    # exact geodesic distances are looked up in a bounded in-memory LRU first,
+    # then in the database, and only computed for pairs neither has seen;
+    # computed distances are written back on flush. Every miss costs a geopy
+    # call of tens of microseconds, so a cold cache is far slower than the
+    # vectorized haversine DistanceMatrix; the cache is opt-in for that reason
+
+    def __init__(self, db: DistanceDatabase = None, max_size: int = MAX_SIZE):
+        self._db = db
+        self._max_size = max_size
+        self._distances: 'OrderedDict[PlayerPairKey, float]' = OrderedDict()
+        self._pending: Dict[PlayerPairKey, float] = dict()
+
+    def __reduce__(self):
+        # worker processes start with an empty front and their own connection
+        return GeodesicCache, (self._db, self._max_size)
+
+    @staticmethod
+    def get_key(player: Player, opponent: Player) -> PlayerPairKey:
+        a = (player.id, float(player.coordinates[0]), float(player.coordinates[1]))
+        b = (opponent.id, float(opponent.coordinates[0]), float(opponent.coordinates[1]))
+        return (a, b) if a <= b else (b, a)
+
+    def get(self, player: Player, opponent: Player) -> float:
+        key = GeodesicCache.get_key(player, opponent)
+        return self._get_many([key])[key]
+
+    def get_pairs(self, teams: List['MatchmakingTeam'], a_indexes: numpy.ndarray,
+                  b_indexes: numpy.ndarray) -> numpy.ndarray:
+        team_pairs: List[Tuple[int, int]] = list(zip(a_indexes.tolist(), b_indexes.tolist()))
+        keys = [[GeodesicCache.get_key(player, opponent)
+                 for player in teams[a].players for opponent in teams[b].players]
+                for a, b in team_pairs]
+        distances = self._get_many(key for edge_keys in keys for key in edge_keys)
+        return numpy.fromiter((sum(distances[key] for key in edge_keys) for edge_keys in keys),
+                              dtype=numpy.float64, count=len(keys))
+
+    def flush(self):
+        if self._db is not None and self._pending:
+            self._db.save_distances(self._pending)
+        self._pending = dict()
+
+    def _get_many(self, keys: Iterable[PlayerPairKey]) -> Dict[PlayerPairKey, float]:
+        distances = dict()
+        missing = list()
+        for key in keys:
+            if key in distances:
+                continue
+            distance = self._distances.get(key)
+            if distance is None:
+                missing.append(key)
+                distances[key] = 0.0
+                continue
+            self._distances.move_to_end(key)
+            distances[key] = distance
+        stored = self._db.get_distances(missing) if self._db is not None and missing else dict()
+        pending = len(self._pending)
+        for key in missing:
+            distance = stored.get(key)
+            if distance is None:
+                (_, *a), (_, *b) = key
+                distance = get_geodesic_miles(a, b)
+                self._pending[key] = distance
+            distances[key] = distance
+            self._remember(key, distance)
+        computed = len(self._pending) - pending
+        metrics.increment('geodesic_cache_hits', len(distances) - computed)
+        metrics.increment('geodesic_cache_misses', computed)
+        return distances
+
+    def _remember(self, key: PlayerPairKey, distance: float):
+        self._distances[key] = distance
+        if len(self._distances) > self._max_size:
+            self._distances.popitem(last=False)
@@ -0,0 +1,122 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+from typing import List
+
+import numpy
+
+from interactor.matchmaking.distance import DistanceMatrix
+from interactor.matchmaking.edge import MatchmakingEdge
+from interactor.matchmaking.geodesic import GeodesicCache
+from interactor.matchmaking.slot import AvailabilitySlotIndex
+from interactor.matchmaking.team import MatchmakingTeam
+
+# the cost of an edge is its distance points plus this much per past meeting
+# of the two teams, so a rematch is worth about 25 extra miles per player pair
+REMATCH_PENALTY = 100.0
+
+
+class MatchmakingGraph:
+    # edges live in parallel arrays: edge k joins teams[sources[k]] and
+    # teams[targets[k]], and its points are distance_points[k] and
+    # past_matches_points[k], combined into costs[k]; the opponents of team i are
+    # neighbours[offsets[i]:offsets[i + 1]], reached through the edges in
+    # edge_ids at the same positions, and ordered from best to worst
+
+    def __init__(self, teams: List[MatchmakingTeam], distances: GeodesicCache = None,
+                 rematch_penalty: float = REMATCH_PENALTY):
+        self._teams = teams
+        self._sources, self._targets = MatchmakingGraph._get_candidate_pairs(teams)
+        if distances is None:
+            self._distance_points = DistanceMatrix(teams).get_pairs(self._sources, self._targets)
+        else:
+            self._distance_points = distances.get_pairs(teams, self._sources, self._targets)
+        self._past_matches_points = MatchmakingGraph._get_past_matches_points(teams, self._sources, self._targets)
+        self._costs = self._distance_points + rematch_penalty * self._past_matches_points
+        self._offsets, self._neighbours, self._edge_ids = self._get_adjacency()
+        # every team reads its own slice of the adjacency in place, so no
+        # per-edge objects are created and scans run over contiguous memory
+        neighbours = memoryview(self._neighbours)
+        edge_ids = memoryview(self._edge_ids)
+        offsets = self._offsets.tolist()
+        for index, team in enumerate(teams):
+            start, end = offsets[index], offsets[index + 1]
+            team.set_adjacency(self, neighbours[start:end], edge_ids[start:end])
+
+    @property
+    def teams(self) -> List[MatchmakingTeam]:
+        return self._teams
+
+    @property
+    def sources(self) -> numpy.ndarray:
+        return self._sources
+
+    @property
+    def targets(self) -> numpy.ndarray:
+        return self._targets
+
+    @property
+    def distance_points(self) -> numpy.ndarray:
+        return self._distance_points
+
+    @property
+    def past_matches_points(self) -> numpy.ndarray:
+        return self._past_matches_points
+
+    @property
+    def costs(self) -> numpy.ndarray:
+        return self._costs
+
+    @property
+    def offsets(self) -> numpy.ndarray:
+        return self._offsets
+
+    @property
+    def neighbours(self) -> numpy.ndarray:
+        return self._neighbours
+
+    @property
+    def edge_ids(self) -> numpy.ndarray:
+        return self._edge_ids
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def get_degree(self, index: int) -> int:
+        return int(self._offsets[index + 1] - self._offsets[index])
+
+    def get_edge(self, edge_id: int) -> MatchmakingEdge:
+        a = self._teams[self._sources[edge_id]]
+        b = self._teams[self._targets[edge_id]]
+        return MatchmakingEdge(a, b, float(self._distance_points[edge_id]), int(self._past_matches_points[edge_id]))
+
+    @staticmethod
+    def _get_candidate_pairs(teams: List[MatchmakingTeam]):
+        pairs = numpy.fromiter((index for pair in AvailabilitySlotIndex(teams).get_candidate_pairs() for index in pair),
+                               dtype=numpy.int32).reshape(-1, 2)
+        return pairs[:, 0].copy(), pairs[:, 1].copy()
+
+    @staticmethod
+    def _get_past_matches_points(teams: List[MatchmakingTeam], sources: numpy.ndarray,
+                                 targets: numpy.ndarray) -> numpy.ndarray:
+        points = numpy.zeros(len(sources), dtype=numpy.int32)
+        for edge_id, (a, b) in enumerate(zip(sources.tolist(), targets.tolist())):
+            points[edge_id] = teams[a].past_opponents.get(teams[b].id, 0)
+        return points
+
+    def _get_adjacency(self):
+        # each edge appears once in the rows of both of its teams; a row is
+        # sorted by cost, then opponent id, which is the order greedy search
+        # tries opponents in
+        teams = len(self._teams)
+        owners = numpy.concatenate((self._sources, self._targets))
+        others = numpy.concatenate((self._targets, self._sources))
+        edge_ids = numpy.tile(numpy.arange(len(self._sources), dtype=numpy.int32), 2)
+        ids = numpy.array([team.id for team in self._teams], dtype=object)
+        id_ranks = numpy.empty(teams, dtype=numpy.int32)
+        id_ranks[numpy.argsort(ids, kind='stable')] = numpy.arange(teams, dtype=numpy.int32)
+        order = numpy.lexsort((id_ranks[others], self._costs[edge_ids], owners))
+        offsets = numpy.zeros(teams + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(owners, minlength=teams), out=offsets[1:])
+        return offsets, others[order], edge_ids[order]
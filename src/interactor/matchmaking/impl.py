@@ -2,141 +2,125 @@
 author: oluiscabral
 date: 8/23/23
 """
-from typing import Set, Iterable, List
+from concurrent.futures import ProcessPoolExecutor, Executor, Future
+from typing import Iterable, Iterator, List, Tuple
 
 from entity.division import Division
 from entity.matchup import Matchup
 from entity.team import Team
+from instrumentation.metrics import metrics
 from interactor.matchmaking import Matchmaking
-from interactor.matchmaking.edge import MatchmakingEdge
+from interactor.matchmaking.component import AvailabilityComponents
+from interactor.matchmaking.geodesic import GeodesicCache
+from interactor.matchmaking.graph import MatchmakingGraph
 from interactor.matchmaking.result import MatchMakingResult
+from interactor.matchmaking.solver import MatchmakingSolver
+from interactor.matchmaking.solver.greedy import GreedyMatchmakingSolver
 from interactor.matchmaking.team import MatchmakingTeam
 
+# pickling a component to a worker and its result back costs about as much as
+# solving it at 256 teams, and about a third of it at 1000
+PARALLEL_COMPONENT_SIZE = 1024
+
 
 class MatchmakingImpl(Matchmaking):
 
     def __init__(self):
         # noinspection PyTypeChecker
-        self._beginner_teams: Set[MatchmakingTeam] = set()
-        self._intermediate_teams: Set[MatchmakingTeam] = set()
-        self._advanced_teams: Set[MatchmakingTeam] = set()
+        self._beginner_teams: List[Team] = list()
+        self._intermediate_teams: List[Team] = list()
+        self._advanced_teams: List[Team] = list()
+        self._solver: MatchmakingSolver = GreedyMatchmakingSolver()
+        self._workers: int = 1
+        self._distances: 'GeodesicCache | None' = None
 
-    def get_best_matchups(self, teams: Iterable[Team]) -> List[Matchup]:
-        matchups: List[Matchup] = list()
-        self._prepare_matchmaking(teams)
-        beginner_matchups = self._get_best_matchups(self._beginner_teams)
-        intermediate_matchups = self._get_best_matchups(self._intermediate_teams)
-        advanced_matchups = self._get_best_matchups(self._advanced_teams)
-        matchups.extend(beginner_matchups)
-        matchups.extend(intermediate_matchups)
-        matchups.extend(advanced_matchups)
-        return matchups
+    def set_solver(self, solver: MatchmakingSolver):
+        self._solver = solver
 
-    def _prepare_matchmaking(self, teams: Iterable[Team]):
-        for team in teams:
-            parsed_team = MatchmakingTeam(team)
-            if Division.BEGINNER == parsed_team.division:
-                self._beginner_teams.add(parsed_team)
-            elif Division.INTERMEDIATE == parsed_team.division:
-                self._intermediate_teams.add(parsed_team)
-            elif Division.ADVANCED == parsed_team.division:
-                self._advanced_teams.add(parsed_team)
-        self._init_division_edges(self._beginner_teams)
-        self._init_division_edges(self._intermediate_teams)
-        self._init_division_edges(self._advanced_teams)
+    def set_workers(self, workers: int):
+        self._workers = workers
 
-    @staticmethod
-    def _init_division_edges(teams: Set[MatchmakingTeam]):
-        for team in teams:
-            MatchmakingImpl._init_edges(team, teams)
+    def set_distance_cache(self, distances: GeodesicCache):
+        self._distances = distances
 
-    @staticmethod
-    def _init_edges(team_a: MatchmakingTeam, teams: Set[MatchmakingTeam]):
-        for team_b in teams:
-            if team_a.id == team_b.id:
-                continue
-            if (team_a.division == team_b.division
-                    and team_a.availability.meets(team_b.availability)):
-                edge = MatchmakingEdge(team_a, team_b)
-                team_a.add_edge(edge)
-                team_b.add_edge(edge)
+    def get_best_matchups(self, teams: Iterable[Team]) -> List[Matchup]:
+        return list(self.iter_best_matchups(teams))
 
-    @staticmethod
-    def _get_best_matchups(teams: Set[MatchmakingTeam]) -> Set[Matchup]:
-        MatchmakingImpl._reset(teams)
-        MatchmakingImpl._init_lonely_matchups(teams)
-        result = MatchmakingImpl._get_matchmaking_result(teams)
-        return result.matchups
+    def iter_best_matchups(self, teams: Iterable[Team]) -> Iterator[Matchup]:
+        for result in self._iter_component_results(teams):
+            yield from result.matchups
 
-    @staticmethod
-    def _reset(teams: Set[MatchmakingTeam]):
-        for team in teams:
-            team.reset()
+    def get_best_result(self, teams: Iterable[Team]) -> MatchMakingResult:
+        return MatchMakingResult.merge(self._iter_component_results(teams))
 
-    @staticmethod
-    def _init_lonely_matchups(teams: Set[MatchmakingTeam]):
+    def _iter_component_results(self, teams: Iterable[Team]) -> Iterator[MatchMakingResult]:
+        # components share no teams, so each result is final as soon as it is
+        # solved and can be handed on before the rest of the league is done
+        self._prepare_matchmaking(teams)
+        divisions = [self._beginner_teams, self._intermediate_teams, self._advanced_teams]
+        with metrics.phase('split_components'):
+            division_components = [AvailabilityComponents(division).split() for division in divisions]
+        if self._workers <= 1:
+            for components in division_components:
+                for component in components:
+                    yield MatchmakingImpl._solve_component(component, self._solver, self._distances)
+            return
+        with ProcessPoolExecutor(self._workers) as executor:
+            yield from self._solve_components_in_parallel(division_components, executor)
+
+    def _solve_components_in_parallel(self, division_components: List[List[List[Team]]],
+                                      executor: Executor) -> Iterator[MatchMakingResult]:
+        # large components go to the workers first, small ones are cheaper to
+        # solve here than to ship, and are solved while the workers run
+        futures: List[Future] = list()
+        small_components: List[List[Team]] = list()
+        for components in division_components:
+            for component in components:
+                if len(component) >= PARALLEL_COMPONENT_SIZE:
+                    futures.append(executor.submit(MatchmakingImpl._solve_component_in_worker, component,
+                                                   self._solver, self._distances, metrics.enabled))
+                else:
+                    small_components.append(component)
+        for component in small_components:
+            yield MatchmakingImpl._solve_component(component, self._solver, self._distances)
+        for future in futures:
+            result, snapshot = future.result()
+            metrics.merge(snapshot)
+            yield result
+
+    def _prepare_matchmaking(self, teams: Iterable[Team]):
+        self._beginner_teams = list()
+        self._intermediate_teams = list()
+        self._advanced_teams = list()
         for team in teams:
-            if team.is_lonely():
-                continue
-            team.search_lonely_edge()
+            if Division.BEGINNER == team.division:
+                self._beginner_teams.append(team)
+            elif Division.INTERMEDIATE == team.division:
+                self._intermediate_teams.append(team)
+            elif Division.ADVANCED == team.division:
+                self._advanced_teams.append(team)
 
     @staticmethod
-    def _create_matchup(best_edge: MatchmakingEdge) -> Matchup:
-        availability = best_edge.a.availability.get_intersection(best_edge.b.availability)
-        contestants = (best_edge.a, best_edge.b)
-        return Matchup(availability, contestants)
+    def _solve_component_in_worker(teams: List[Team], solver: MatchmakingSolver, distances: GeodesicCache,
+                                   metrics_enabled: bool) -> Tuple[MatchMakingResult, dict]:
+        # a forked worker inherits the parent's counts, so it starts from zero
+        # and only reports what this component added
+        metrics.reset()
+        if metrics_enabled:
+            metrics.enable()
+        else:
+            metrics.disable()
+        result = MatchmakingImpl._solve_component(teams, solver, distances)
+        return result, metrics.snapshot()
 
     @staticmethod
-    def _get_matchmaking_result(teams: Set[MatchmakingTeam]) -> MatchMakingResult:
-        byes = 0
-        matchups = set()
-        distance_points = 0
-        past_matches_points = 0
-        while True:
-            possible_edges = MatchmakingImpl._get_possible_edges(teams)
-            if possible_edges == 0:
-                break
-            for team in teams:
-                already_computed = False
-                for matchup in matchups:
-                    if team in matchup.contestants:
-                        already_computed = True
-                        break
-                if already_computed:
-                    continue
-                if team.is_lonely():
-                    continue
-                best_edge = team.search_lonely_edge()
-                if best_edge is None:
-                    continue
-                matchup = MatchmakingImpl._create_matchup(best_edge)
-                matchups.add(matchup)
-                distance_points += best_edge.distance_points
-                past_matches_points += best_edge.past_matches_points
-            for team in teams:
-                already_computed = False
-                for matchup in matchups:
-                    if team in matchup.contestants:
-                        already_computed = True
-                        break
-                if already_computed:
-                    continue
-                best_edge = team.search_best_edge()
-                if best_edge is None:
-                    continue
-                matchup = MatchmakingImpl._create_matchup(best_edge)
-                matchups.add(matchup)
-                distance_points += best_edge.distance_points
-                past_matches_points += best_edge.past_matches_points
-        for team in teams:
-            if not team.has_found_best_edge():
-                byes += 1
-        return MatchMakingResult(byes, matchups, distance_points, past_matches_points)
-
-    @classmethod
-    def _get_possible_edges(cls, teams: Set[MatchmakingTeam]) -> int:
-        possible_edges = 0
-        for team in teams:
-            if not team.has_found_best_edge():
-                possible_edges += team.get_possible_edges()
-        return possible_edges
+    def _solve_component(teams: List[Team], solver: MatchmakingSolver,
+                         distances: GeodesicCache = None) -> MatchMakingResult:
+        with metrics.phase('build_edges'):
+            graph = MatchmakingGraph([MatchmakingTeam(team) for team in teams], distances)
+            if distances is not None:
+                distances.flush()
+        metrics.increment('components_solved')
+        metrics.increment('edges_created', len(graph))
+        with metrics.phase('solve'):
+            return solver.solve(graph)
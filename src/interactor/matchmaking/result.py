@@ -3,7 +3,7 @@ author: oluiscabral
 date: 8/23/23
 """
 from dataclasses import dataclass
-from typing import Set
+from typing import Set, Iterable
 
 from entity.matchup import Matchup
 
@@ -15,6 +15,19 @@ class MatchMakingResult:
     distance_points: float
     past_matches_points: int
 
+    @staticmethod
+    def merge(results: Iterable['MatchMakingResult']) -> 'MatchMakingResult':
+        byes = 0
+        matchups = set()
+        distance_points = 0
+        past_matches_points = 0
+        for result in results:
+            byes += result.byes
+            matchups.update(result.matchups)
+            distance_points += result.distance_points
+            past_matches_points += result.past_matches_points
+        return MatchMakingResult(byes, matchups, distance_points, past_matches_points)
+
     def is_better_than(self, other: 'MatchMakingResult'):
         if self.byes < other.byes:
             return True
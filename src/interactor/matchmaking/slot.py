@@ -0,0 +1,34 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import datetime
+from collections import defaultdict
+from typing import Sequence, Iterator, Dict, List, Tuple
+
+from interactor.matchmaking.team import MatchmakingTeam
+
+
+class AvailabilitySlotIndex:
+
+    def __init__(self, teams: Sequence[MatchmakingTeam]):
+        self._teams = teams
+        self._indexes_by_slot: Dict[Tuple[datetime.date, int], List[int]] = defaultdict(list)
+        for index, team in enumerate(teams):
+            for slot in team.availability.slots():
+                self._indexes_by_slot[slot].append(index)
+
+    def get_teams(self, slot: Tuple[datetime.date, int]) -> List[MatchmakingTeam]:
+        return [self._teams[index] for index in self._indexes_by_slot.get(slot, list())]
+
+    def get_candidate_pairs(self) -> Iterator[Tuple[int, int]]:
+        seen = set()
+        teams = len(self._teams)
+        for indexes in self._indexes_by_slot.values():
+            for position, index_a in enumerate(indexes):
+                for index_b in indexes[position + 1:]:
+                    key = index_a * teams + index_b
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    yield index_a, index_b
@@ -0,0 +1,13 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+from abc import ABC
+from interactor.matchmaking.graph import MatchmakingGraph
+from interactor.matchmaking.result import MatchMakingResult
+
+
+class MatchmakingSolver(ABC):
+
+    def solve(self, graph: MatchmakingGraph) -> MatchMakingResult:
+        pass
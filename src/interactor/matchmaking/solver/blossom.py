@@ -0,0 +1,68 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import numpy
+
+from instrumentation.metrics import metrics
+from interactor.matchmaking.graph import MatchmakingGraph
+from interactor.matchmaking.result import MatchMakingResult
+from interactor.matchmaking.solver import MatchmakingSolver
+from interactor.matchmaking.solver.builder import MatchMakingResultBuilder
+from interactor.matchmaking.solver.greedy import GreedyMatchmakingSolver
+from interactor.matchmaking.solver.matching import MaximumWeightMatching
+
+# a dense component of this size takes a few seconds in the pure Python
+# engine and one of a thousand teams well over a minute, so larger ones are
+# solved greedily instead
+MAX_COMPONENT_TEAMS = 400
+
+
+class BlossomMatchmakingSolver(MatchmakingSolver):
+
+    def __init__(self, precision: int = 100, max_teams: int = MAX_COMPONENT_TEAMS):
+        self._precision = precision
+        self._max_teams = max_teams
+        self._fallback = GreedyMatchmakingSolver()
+
+    def solve(self, graph: MatchmakingGraph) -> MatchMakingResult:
+        if len(graph.teams) > self._max_teams:
+            metrics.increment('blossom_fallbacks')
+            return self._fallback.solve(graph)
+        for team in graph.teams:
+            team.reset()
+        matching = BlossomMatchmakingSolver._get_matching(graph, self._get_weights(graph))
+        mate = numpy.array(matching.solve(), dtype=numpy.int64)
+        metrics.increment('solver_iterations', matching.stages)
+        return BlossomMatchmakingSolver._get_matchmaking_result(graph, mate)
+
+    def _get_weights(self, graph: MatchmakingGraph) -> numpy.ndarray:
+        # maximum cardinality comes first, so any weight that decreases with the
+        # cost turns the maximum weight matching into a minimum cost one
+        costs = graph.costs
+        max_cost = costs.max(initial=0)
+        return numpy.rint((max_cost - costs) * self._precision).astype(numpy.int64) + 1
+
+    @staticmethod
+    def _get_matching(graph: MatchmakingGraph, weights: numpy.ndarray) -> MaximumWeightMatching:
+        # the engine reads the graph arrays in place: endpoint 2k + 1 of edge
+        # k is its target, so a team that is the source of an edge reaches
+        # the other side through it, and a target through 2k
+        endpoint = numpy.column_stack((graph.sources, graph.targets)).ravel()
+        owners = numpy.repeat(numpy.arange(len(graph.teams), dtype=numpy.int32), numpy.diff(graph.offsets))
+        ends = (2 * graph.edge_ids + (graph.sources[graph.edge_ids] == owners)).astype(numpy.int32)
+        ends_view = memoryview(ends)
+        offsets = graph.offsets.tolist()
+        neighbend = [ends_view[offsets[index]:offsets[index + 1]] for index in range(len(graph.teams))]
+        return MaximumWeightMatching(len(graph.teams), memoryview(endpoint), memoryview(weights), neighbend)
+
+    @staticmethod
+    def _get_matchmaking_result(graph: MatchmakingGraph, mate: numpy.ndarray) -> MatchMakingResult:
+        builder = MatchMakingResultBuilder()
+        if len(graph) > 0:
+            for edge_id in numpy.flatnonzero(mate[graph.sources] == graph.targets).tolist():
+                edge = graph.get_edge(edge_id)
+                edge.a.set_best_edge(edge)
+                edge.b.set_best_edge(edge)
+                builder.add_matchup(edge)
+        return builder.build(graph.teams)
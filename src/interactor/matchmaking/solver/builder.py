@@ -0,0 +1,42 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+from typing import Set, Iterable
+
+from entity.matchup import Matchup
+from interactor.matchmaking.edge import MatchmakingEdge
+from interactor.matchmaking.result import MatchMakingResult
+from interactor.matchmaking.team import MatchmakingTeam
+
+
+class MatchMakingResultBuilder:
+
+    def __init__(self):
+        self._matched: Set[MatchmakingTeam] = set()
+        self._matchups: Set[Matchup] = set()
+        self._distance_points: float = 0
+        self._past_matches_points: int = 0
+
+    def is_matched(self, team: MatchmakingTeam) -> bool:
+        return team in self._matched
+
+    def add_matchup(self, edge: MatchmakingEdge):
+        self._matched.add(edge.a)
+        self._matched.add(edge.b)
+        self._matchups.add(MatchMakingResultBuilder._create_matchup(edge))
+        self._distance_points += edge.distance_points
+        self._past_matches_points += edge.past_matches_points
+
+    def build(self, teams: Iterable[MatchmakingTeam]) -> MatchMakingResult:
+        byes = 0
+        for team in teams:
+            if not team.has_found_best_edge():
+                byes += 1
+        return MatchMakingResult(byes, self._matchups, self._distance_points, self._past_matches_points)
+
+    @staticmethod
+    def _create_matchup(edge: MatchmakingEdge) -> Matchup:
+        availability = edge.a.availability.get_intersection(edge.b.availability)
+        contestants = (edge.a, edge.b)
+        return Matchup(availability, contestants)
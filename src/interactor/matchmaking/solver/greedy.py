@@ -0,0 +1,81 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import heapq
+from typing import Dict, List
+
+from instrumentation.metrics import metrics
+from interactor.matchmaking.graph import MatchmakingGraph
+from interactor.matchmaking.result import MatchMakingResult
+from interactor.matchmaking.solver import MatchmakingSolver
+from interactor.matchmaking.solver.builder import MatchMakingResultBuilder
+from interactor.matchmaking.state import MatchmakingState
+from interactor.matchmaking.team import MatchmakingTeam
+
+
+class GreedyMatchmakingSolver(MatchmakingSolver):
+
+    def solve(self, graph: MatchmakingGraph) -> MatchMakingResult:
+        teams = graph.teams
+        state = MatchmakingState(teams)
+        builder = MatchMakingResultBuilder()
+        GreedyMatchmakingSolver._init_lonely_matchups(teams, state, builder)
+        return GreedyMatchmakingSolver._get_matchmaking_result(teams, state, builder)
+
+    @staticmethod
+    def _init_lonely_matchups(teams: List[MatchmakingTeam], state: MatchmakingState,
+                              builder: MatchMakingResultBuilder):
+        # these pairs must reach the builder here: they may use up every edge
+        # of the component, and then the main loop never runs
+        positions = {team: position for position, team in enumerate(teams)}
+        GreedyMatchmakingSolver._match_lonely_teams(teams, positions, state, builder)
+
+    @staticmethod
+    def _match_lonely_teams(teams: List[MatchmakingTeam], positions: Dict[MatchmakingTeam, int],
+                            state: MatchmakingState, builder: MatchMakingResultBuilder) -> int:
+        # a pass over the teams in order, visiting only opponents of lonely
+        # teams; teams that turn lonely during the pass bring in their
+        # opponents that the pass has not reached yet
+        state.pop_new_lonely_teams()
+        pending = [positions[team] for team in state.get_lonely_opponents()]
+        heapq.heapify(pending)
+        queued = set(pending)
+        searches = 0
+        while pending:
+            position = heapq.heappop(pending)
+            team = teams[position]
+            if builder.is_matched(team) or team.is_lonely():
+                continue
+            searches += 1
+            best_edge = team.search_lonely_edge()
+            if best_edge is None:
+                continue
+            builder.add_matchup(best_edge)
+            for opponent in state.get_lonely_opponents(state.pop_new_lonely_teams()):
+                opponent_position = positions[opponent]
+                if opponent_position > position and opponent_position not in queued:
+                    queued.add(opponent_position)
+                    heapq.heappush(pending, opponent_position)
+        return searches
+
+    @staticmethod
+    def _get_matchmaking_result(teams: List[MatchmakingTeam], state: MatchmakingState,
+                                builder: MatchMakingResultBuilder) -> MatchMakingResult:
+        positions = {team: position for position, team in enumerate(teams)}
+        iterations = lonely_searches = best_searches = 0
+        while state.possible_edges > 0:
+            iterations += 1
+            if state.lonely_teams:
+                lonely_searches += GreedyMatchmakingSolver._match_lonely_teams(teams, positions, state, builder)
+            for team in teams:
+                if builder.is_matched(team):
+                    continue
+                best_searches += 1
+                best_edge = team.search_best_edge()
+                if best_edge is not None:
+                    builder.add_matchup(best_edge)
+        metrics.increment('solver_iterations', iterations)
+        metrics.increment('search_lonely_edge_calls', lonely_searches)
+        metrics.increment('search_best_edge_calls', best_searches)
+        return builder.build(teams)
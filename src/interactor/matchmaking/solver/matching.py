@@ -0,0 +1,427 @@
+"""
+author: oluiscabral
+date: 10/18/26
+
+Edmonds' blossom algorithm for maximum weight matching in general graphs,
+with the primal-dual bookkeeping of Galil ("Efficient algorithms for finding
+maximum matching in graphs", 1986). Runs in O(n^3) time and O(m) memory.
+With integer weights every computation stays in integer arithmetic.
+
+Every stage augments a single path and rescans the edges of each labelled
+vertex, which in pure Python bounds the practical size: a component of a few
+hundred teams solves in a second or two, one of a thousand densely connected
+teams takes well over a minute. BlossomMatchmakingSolver hands components
+above MAX_COMPONENT_TEAMS to the greedy solver for that reason.
+"""
+from typing import List, Tuple, Iterator, Sequence
+
+Edge = Tuple[int, int, int]
+
+
+class MaximumWeightMatching:
+    # edge k joins endpoint[2 * k] and endpoint[2 * k + 1] with weights[k];
+    # neighbend[v] holds, for every edge at v, the endpoint number p with
+    # endpoint[p] on the other side. Any indexable sequences of ints will do,
+    # so array-backed graphs are read in place
+
+    def __init__(self, vertices: int, endpoint: Sequence[int], weights: Sequence[int],
+                 neighbend: Sequence[Sequence[int]], max_cardinality: bool = True):
+        self._vertices = vertices
+        self._endpoint = endpoint
+        self._weights = weights
+        self._neighbend = neighbend
+        self._max_cardinality = max_cardinality
+        n = vertices
+        max_weight = max(0, max(weights, default=0))
+        self._mate = n * [-1]
+        self._label = (2 * n) * [0]
+        self._labelend = (2 * n) * [-1]
+        self._inblossom = list(range(n))
+        self._blossomparent = (2 * n) * [-1]
+        self._blossomchilds: List['List[int] | None'] = (2 * n) * [None]
+        self._blossombase = list(range(n)) + n * [-1]
+        self._blossomendps: List['List[int] | None'] = (2 * n) * [None]
+        self._bestedge = (2 * n) * [-1]
+        self._blossombestedges: List['List[int] | None'] = (2 * n) * [None]
+        self._unusedblossoms = list(range(n, 2 * n))
+        self._dualvar = n * [max_weight] + n * [0]
+        self._allowedge = bytearray(len(weights))
+        self._queue: List[int] = list()
+        self._stages = 0
+
+    @staticmethod
+    def from_edges(vertices: int, edges: List[Edge], max_cardinality: bool = True) -> 'MaximumWeightMatching':
+        endpoint = [edges[p // 2][p % 2] for p in range(2 * len(edges))]
+        neighbend: List[List[int]] = [list() for _ in range(vertices)]
+        for k, (i, j, _) in enumerate(edges):
+            neighbend[i].append(2 * k + 1)
+            neighbend[j].append(2 * k)
+        return MaximumWeightMatching(vertices, endpoint, [weight for _, _, weight in edges], neighbend,
+                                     max_cardinality)
+
+    @property
+    def stages(self) -> int:
+        return self._stages
+
+    def solve(self) -> List[int]:
+        if len(self._weights) == 0:
+            return self._vertices * [-1]
+        for _ in range(self._vertices):
+            self._stages += 1
+            if not self._run_stage():
+                break
+            self._expand_tight_blossoms()
+        mate = list()
+        for v in range(self._vertices):
+            mate.append(self._endpoint[self._mate[v]] if self._mate[v] >= 0 else -1)
+        return mate
+
+    def _slack(self, k: int) -> int:
+        return self._dualvar[self._endpoint[2 * k]] + self._dualvar[self._endpoint[2 * k + 1]] - 2 * self._weights[k]
+
+    def _blossom_leaves(self, b: int) -> Iterator[int]:
+        n = self._vertices
+        stack = [b]
+        while stack:
+            t = stack.pop()
+            if t < n:
+                yield t
+            else:
+                stack.extend(reversed(self._blossomchilds[t]))
+
+    def _run_stage(self) -> bool:
+        n = self._vertices
+        label = self._label
+        inblossom = self._inblossom
+        label[:] = (2 * n) * [0]
+        self._bestedge[:] = (2 * n) * [-1]
+        self._blossombestedges[n:] = n * [None]
+        self._allowedge[:] = bytes(len(self._weights))
+        self._queue[:] = []
+        for v in range(n):
+            if self._mate[v] == -1 and label[inblossom[v]] == 0:
+                self._assign_label(v, 1, -1)
+        while True:
+            if self._scan_queue():
+                return True
+            if not self._update_duals():
+                return False
+
+    def _scan_queue(self) -> bool:
+        # every stage rescans the edges of each S-vertex, so this loop carries
+        # most of the running time and computes the slacks inline
+        label = self._label
+        inblossom = self._inblossom
+        bestedge = self._bestedge
+        allowedge = self._allowedge
+        dualvar = self._dualvar
+        endpoint = self._endpoint
+        weights = self._weights
+        queue = self._queue
+        while queue:
+            v = queue.pop()
+            dual_v = dualvar[v]
+            for p in self._neighbend[v]:
+                k = p >> 1
+                w = endpoint[p]
+                bw = inblossom[w]
+                if inblossom[v] == bw:
+                    continue
+                kslack = 0
+                if not allowedge[k]:
+                    kslack = dual_v + dualvar[w] - 2 * weights[k]
+                    if kslack <= 0:
+                        allowedge[k] = True
+                if allowedge[k]:
+                    if label[bw] == 0:
+                        self._assign_label(w, 2, p ^ 1)
+                    elif label[bw] == 1:
+                        base = self._scan_blossom(v, w)
+                        if base >= 0:
+                            self._add_blossom(base, k)
+                        else:
+                            self._augment_matching(k)
+                            return True
+                    elif label[w] == 0:
+                        label[w] = 2
+                        self._labelend[w] = p ^ 1
+                elif label[bw] == 1:
+                    b = inblossom[v]
+                    best = bestedge[b]
+                    if best == -1 or kslack < (dualvar[endpoint[2 * best]] + dualvar[endpoint[2 * best + 1]]
+                                               - 2 * weights[best]):
+                        bestedge[b] = k
+                elif label[w] == 0:
+                    best = bestedge[w]
+                    if best == -1 or kslack < (dualvar[endpoint[2 * best]] + dualvar[endpoint[2 * best + 1]]
+                                               - 2 * weights[best]):
+                        bestedge[w] = k
+        return False
+
+    def _update_duals(self) -> bool:
+        n = self._vertices
+        label = self._label
+        inblossom = self._inblossom
+        bestedge = self._bestedge
+        dualvar = self._dualvar
+        delta_type = -1
+        delta = delta_edge = delta_blossom = None
+        if not self._max_cardinality:
+            delta_type = 1
+            delta = min(dualvar[:n])
+        for v in range(n):
+            if label[inblossom[v]] == 0 and bestedge[v] != -1:
+                d = self._slack(bestedge[v])
+                if delta_type == -1 or d < delta:
+                    delta, delta_type, delta_edge = d, 2, bestedge[v]
+        for b in range(2 * n):
+            if self._blossomparent[b] == -1 and label[b] == 1 and bestedge[b] != -1:
+                d = self._slack(bestedge[b]) // 2
+                if delta_type == -1 or d < delta:
+                    delta, delta_type, delta_edge = d, 3, bestedge[b]
+        for b in range(n, 2 * n):
+            if (self._blossombase[b] >= 0 and self._blossomparent[b] == -1 and label[b] == 2
+                    and (delta_type == -1 or dualvar[b] < delta)):
+                delta, delta_type, delta_blossom = dualvar[b], 4, b
+        if delta_type == -1:
+            delta_type = 1
+            delta = max(0, min(dualvar[:n]))
+        for v in range(n):
+            if label[inblossom[v]] == 1:
+                dualvar[v] -= delta
+            elif label[inblossom[v]] == 2:
+                dualvar[v] += delta
+        for b in range(n, 2 * n):
+            if self._blossombase[b] >= 0 and self._blossomparent[b] == -1:
+                if label[b] == 1:
+                    dualvar[b] += delta
+                elif label[b] == 2:
+                    dualvar[b] -= delta
+        if delta_type == 1:
+            return False
+        if delta_type == 2:
+            self._allowedge[delta_edge] = True
+            i, j = self._endpoint[2 * delta_edge], self._endpoint[2 * delta_edge + 1]
+            if label[inblossom[i]] == 0:
+                i, j = j, i
+            self._queue.append(i)
+        elif delta_type == 3:
+            self._allowedge[delta_edge] = True
+            i = self._endpoint[2 * delta_edge]
+            self._queue.append(i)
+        elif delta_type == 4:
+            self._expand_blossom(delta_blossom, False)
+        return True
+
+    def _expand_tight_blossoms(self):
+        n = self._vertices
+        for b in range(n, 2 * n):
+            if (self._blossomparent[b] == -1 and self._blossombase[b] >= 0
+                    and self._label[b] == 1 and self._dualvar[b] == 0):
+                self._expand_blossom(b, True)
+
+    def _assign_label(self, w: int, t: int, p: int):
+        while True:
+            b = self._inblossom[w]
+            self._label[w] = self._label[b] = t
+            self._labelend[w] = self._labelend[b] = p
+            self._bestedge[w] = self._bestedge[b] = -1
+            if t == 1:
+                self._queue.extend(self._blossom_leaves(b))
+                return
+            base = self._blossombase[b]
+            w, t, p = self._endpoint[self._mate[base]], 1, self._mate[base] ^ 1
+
+    def _scan_blossom(self, v: int, w: int) -> int:
+        label = self._label
+        path = list()
+        base = -1
+        while v != -1 or w != -1:
+            b = self._inblossom[v]
+            if label[b] & 4:
+                base = self._blossombase[b]
+                break
+            path.append(b)
+            label[b] = 5
+            if self._labelend[b] == -1:
+                v = -1
+            else:
+                v = self._endpoint[self._labelend[b]]
+                b = self._inblossom[v]
+                v = self._endpoint[self._labelend[b]]
+            if w != -1:
+                v, w = w, v
+        for b in path:
+            label[b] = 1
+        return base
+
+    def _add_blossom(self, base: int, k: int):
+        inblossom = self._inblossom
+        v, w = self._endpoint[2 * k], self._endpoint[2 * k + 1]
+        bb = inblossom[base]
+        bv = inblossom[v]
+        bw = inblossom[w]
+        b = self._unusedblossoms.pop()
+        self._blossombase[b] = base
+        self._blossomparent[b] = -1
+        self._blossomparent[bb] = b
+        self._blossomchilds[b] = path = list()
+        self._blossomendps[b] = endps = list()
+        while bv != bb:
+            self._blossomparent[bv] = b
+            path.append(bv)
+            endps.append(self._labelend[bv])
+            v = self._endpoint[self._labelend[bv]]
+            bv = inblossom[v]
+        path.append(bb)
+        path.reverse()
+        endps.reverse()
+        endps.append(2 * k)
+        while bw != bb:
+            self._blossomparent[bw] = b
+            path.append(bw)
+            endps.append(self._labelend[bw] ^ 1)
+            w = self._endpoint[self._labelend[bw]]
+            bw = inblossom[w]
+        self._label[b] = 1
+        self._labelend[b] = self._labelend[bb]
+        self._dualvar[b] = 0
+        for v in self._blossom_leaves(b):
+            if self._label[inblossom[v]] == 2:
+                self._queue.append(v)
+            inblossom[v] = b
+        best_edge_to = dict()
+        for bv in path:
+            if self._blossombestedges[bv] is None:
+                neighbour_lists = [[p // 2 for p in self._neighbend[v]] for v in self._blossom_leaves(bv)]
+            else:
+                neighbour_lists = [self._blossombestedges[bv]]
+            for neighbour_list in neighbour_lists:
+                for k in neighbour_list:
+                    i, j = self._endpoint[2 * k], self._endpoint[2 * k + 1]
+                    if inblossom[j] == b:
+                        i, j = j, i
+                    bj = inblossom[j]
+                    if (bj != b and self._label[bj] == 1
+                            and (bj not in best_edge_to or self._slack(k) < self._slack(best_edge_to[bj]))):
+                        best_edge_to[bj] = k
+            self._blossombestedges[bv] = None
+            self._bestedge[bv] = -1
+        self._blossombestedges[b] = list(best_edge_to.values())
+        self._bestedge[b] = -1
+        for k in self._blossombestedges[b]:
+            if self._bestedge[b] == -1 or self._slack(k) < self._slack(self._bestedge[b]):
+                self._bestedge[b] = k
+
+    def _expand_blossom(self, b: int, end_stage: bool):
+        n = self._vertices
+        label = self._label
+        for s in self._blossomchilds[b]:
+            self._blossomparent[s] = -1
+            if s < n:
+                self._inblossom[s] = s
+            elif end_stage and self._dualvar[s] == 0:
+                self._expand_blossom(s, end_stage)
+            else:
+                for v in self._blossom_leaves(s):
+                    self._inblossom[v] = s
+        if not end_stage and label[b] == 2:
+            childs = self._blossomchilds[b]
+            endps = self._blossomendps[b]
+            entry_child = self._inblossom[self._endpoint[self._labelend[b] ^ 1]]
+            j = childs.index(entry_child)
+            if j & 1:
+                j -= len(childs)
+                j_step = 1
+                endp_trick = 0
+            else:
+                j_step = -1
+                endp_trick = 1
+            p = self._labelend[b]
+            while j != 0:
+                label[self._endpoint[p ^ 1]] = 0
+                label[self._endpoint[endps[j - endp_trick] ^ endp_trick ^ 1]] = 0
+                self._assign_label(self._endpoint[p ^ 1], 2, p)
+                self._allowedge[endps[j - endp_trick] // 2] = True
+                j += j_step
+                p = endps[j - endp_trick] ^ endp_trick
+                self._allowedge[p // 2] = True
+                j += j_step
+            bv = childs[j]
+            label[self._endpoint[p ^ 1]] = label[bv] = 2
+            self._labelend[self._endpoint[p ^ 1]] = self._labelend[bv] = p
+            self._bestedge[bv] = -1
+            j += j_step
+            while childs[j] != entry_child:
+                bv = childs[j]
+                if label[bv] == 1:
+                    j += j_step
+                    continue
+                labelled = -1
+                for v in self._blossom_leaves(bv):
+                    if label[v] != 0:
+                        labelled = v
+                        break
+                if labelled >= 0:
+                    label[labelled] = 0
+                    label[self._endpoint[self._mate[self._blossombase[bv]]]] = 0
+                    self._assign_label(labelled, 2, self._labelend[labelled])
+                j += j_step
+        label[b] = self._labelend[b] = -1
+        self._blossomchilds[b] = self._blossomendps[b] = None
+        self._blossombase[b] = -1
+        self._blossombestedges[b] = None
+        self._bestedge[b] = -1
+        self._unusedblossoms.append(b)
+
+    def _augment_blossom(self, b: int, v: int):
+        n = self._vertices
+        t = v
+        while self._blossomparent[t] != b:
+            t = self._blossomparent[t]
+        if t >= n:
+            self._augment_blossom(t, v)
+        childs = self._blossomchilds[b]
+        endps = self._blossomendps[b]
+        i = j = childs.index(t)
+        if i & 1:
+            j -= len(childs)
+            j_step = 1
+            endp_trick = 0
+        else:
+            j_step = -1
+            endp_trick = 1
+        while j != 0:
+            j += j_step
+            t = childs[j]
+            p = endps[j - endp_trick] ^ endp_trick
+            if t >= n:
+                self._augment_blossom(t, self._endpoint[p])
+            j += j_step
+            t = childs[j]
+            if t >= n:
+                self._augment_blossom(t, self._endpoint[p ^ 1])
+            self._mate[self._endpoint[p]] = p ^ 1
+            self._mate[self._endpoint[p ^ 1]] = p
+        self._blossomchilds[b] = childs[i:] + childs[:i]
+        self._blossomendps[b] = endps[i:] + endps[:i]
+        self._blossombase[b] = self._blossombase[self._blossomchilds[b][0]]
+
+    def _augment_matching(self, k: int):
+        v, w = self._endpoint[2 * k], self._endpoint[2 * k + 1]
+        for s, p in ((v, 2 * k + 1), (w, 2 * k)):
+            while True:
+                bs = self._inblossom[s]
+                if bs >= self._vertices:
+                    self._augment_blossom(bs, s)
+                self._mate[s] = p
+                if self._labelend[bs] == -1:
+                    break
+                t = self._endpoint[self._labelend[bs]]
+                bt = self._inblossom[t]
+                s = self._endpoint[self._labelend[bt]]
+                j = self._endpoint[self._labelend[bt] ^ 1]
+                if bt >= self._vertices:
+                    self._augment_blossom(bt, j)
+                self._mate[j] = self._labelend[bt]
+                p = self._labelend[bt] ^ 1
@@ -0,0 +1,55 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+from typing import Iterable, List, Set
+
+from interactor.matchmaking.team import MatchmakingTeam
+
+
+class MatchmakingState:
+
+    def __init__(self, teams: Iterable[MatchmakingTeam]):
+        self._possible_edges: int = 0
+        self._lonely_teams: Set[MatchmakingTeam] = set()
+        self._new_lonely_teams: List[MatchmakingTeam] = list()
+        for team in teams:
+            team.reset(self)
+            self._possible_edges += team.get_possible_edges()
+            self.update_lonely_team(team)
+
+    @property
+    def possible_edges(self) -> int:
+        return self._possible_edges
+
+    @property
+    def lonely_teams(self) -> Set[MatchmakingTeam]:
+        return self._lonely_teams
+
+    def remove_possible_edges(self, possible_edges: int):
+        self._possible_edges -= possible_edges
+
+    def update_lonely_team(self, team: MatchmakingTeam):
+        # the unmatched teams with exactly one unmatched opponent left; a team
+        # leaves the set once it is matched or its last opponent is taken
+        if team.get_possible_edges() == 1 and not team.has_found_best_edge():
+            if team not in self._lonely_teams:
+                self._lonely_teams.add(team)
+                self._new_lonely_teams.append(team)
+        else:
+            self._lonely_teams.discard(team)
+
+    def pop_new_lonely_teams(self) -> List[MatchmakingTeam]:
+        new_lonely_teams = self._new_lonely_teams
+        self._new_lonely_teams = list()
+        return new_lonely_teams
+
+    def get_lonely_opponents(self, lonely_teams: Iterable[MatchmakingTeam] = None) -> Set[MatchmakingTeam]:
+        # the teams that can pick a lonely team: its unmatched opponents that
+        # are not lonely themselves
+        opponents = set()
+        for team in self._lonely_teams if lonely_teams is None else lonely_teams:
+            for opponent in team.iter_opponents():
+                if not opponent.has_found_best_edge() and not opponent.is_lonely():
+                    opponents.add(opponent)
+        return opponents
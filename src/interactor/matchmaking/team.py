@@ -2,7 +2,7 @@
 author: oluiscabral
 date: 8/23/23
 """
-from typing import Set, List
+from typing import Dict, Iterator, List, Sequence, Tuple
 
 from entity.availability import Availability
 from entity.city import City
@@ -19,8 +19,18 @@ class MatchmakingTeam:
     def __init__(self, team: Team):
         self._team: Team = team
         self._is_searching: bool = False
-        self._edges: Set['MatchmakingEdge'] = set()
+        # noinspection PyTypeChecker
+        self._graph: 'MatchmakingGraph' = None
+        self._neighbours: Sequence[int] = ()
+        self._edge_ids: Sequence[int] = ()
         self._best_edge: 'MatchmakingEdge | None' = None
+        self._candidate_index: int = 0
+        self._remaining_degree: int = 0
+        self._state: 'MatchmakingState | None' = None
+
+    def __reduce__(self):
+        # only the wrapped team crosses process boundaries, never the edge graph
+        return MatchmakingTeam, (self._team,)
 
     @property
     def id(self) -> str:
@@ -39,13 +49,17 @@ class MatchmakingTeam:
         return self._team.division
 
     @property
-    def players(self) -> List[Player]:
+    def players(self) -> Tuple[Player, ...]:
         return self._team.players
 
     @property
-    def past_matches(self) -> List[Match]:
+    def past_matches(self) -> Tuple[Match, ...]:
         return self._team.past_matches
 
+    @property
+    def past_opponents(self) -> Dict[str, int]:
+        return self._team.past_opponents
+
     @property
     def availability(self) -> Availability:
         return self._team.availability
@@ -61,84 +75,101 @@ class MatchmakingTeam:
         return self._best_edge is not None
 
     def is_lonely(self) -> bool:
-        possible_edges = 0
-        for edge in self._edges:
-            node = self._get_output_node(edge)
-            if not node.has_found_best_edge():
-                possible_edges += 1
-            if possible_edges > 1:
-                return False
-        return True
-
-    def get_possible_edges(self):
-        possible_edges = 0
-        for edge in self._edges:
-            node = self._get_output_node(edge)
-            if not node.has_found_best_edge():
-                possible_edges += 1
-        return possible_edges
-
-    def add_edge(self, edge: 'MatchmakingEdge'):
-        for stored_edge in self._edges:
-            if edge.a == stored_edge.a and edge.b == stored_edge.b:
-                return
-            if edge.a == stored_edge.b and edge.b == stored_edge.a:
-                return
-        self._edges.add(edge)
+        return self._remaining_degree <= 1
+
+    def get_possible_edges(self) -> int:
+        return self._remaining_degree
+
+    def set_adjacency(self, graph: 'MatchmakingGraph', neighbours: Sequence[int], edge_ids: Sequence[int]):
+        # the team's row of the graph adjacency, opponents ordered from best
+        # to worst, as positions in graph.teams and graph edge ids
+        self._graph = graph
+        self._neighbours = neighbours
+        self._edge_ids = edge_ids
+        self._candidate_index = 0
+        self._remaining_degree = len(neighbours)
+
+    def iter_opponents(self) -> Iterator['MatchmakingTeam']:
+        teams = self._graph.teams
+        for neighbour in self._neighbours:
+            yield teams[neighbour]
 
     def search_best_edge(self) -> MatchmakingEdge | None:
+        # follows the chain of preferred opponents with an explicit path
+        # instead of recursion, until two searching teams prefer each other
+        teams = self._graph.teams
+        path: List['MatchmakingTeam'] = [self]
         self._is_searching = True
-        while True:
-            best_edge: 'MatchmakingEdge | None' = None
-            best_edge_node: 'MatchMakingTeam | None' = None
-            if self.has_found_best_edge():
-                self._is_searching = False
-                return self._best_edge
-            for edge in self._edges:
-                node = self._get_output_node(edge)
-                if node.has_found_best_edge():
-                    continue
-                if (best_edge is None
-                        or (edge.distance_points <= best_edge.distance_points
-                            and edge.past_matches_points <= best_edge.past_matches_points)):
-                    best_edge = edge
-                    best_edge_node = node
-            if best_edge_node is None:
-                return None
+        while path:
+            node = path[-1]
+            if node.has_found_best_edge():
+                path.pop()
+                continue
+            candidate = node._get_best_candidate()
+            if candidate < 0:
+                node._is_searching = False
+                path.pop()
+                continue
+            best_edge_node = teams[node._neighbours[candidate]]
             if best_edge_node.is_searching():
-                self.set_best_edge(best_edge)
+                best_edge = self._graph.get_edge(node._edge_ids[candidate])
+                node.set_best_edge(best_edge)
                 best_edge_node.set_best_edge(best_edge)
-                return self._best_edge
+                path.pop()
             else:
-                best_edge_node.search_best_edge()
+                best_edge_node._is_searching = True
+                path.append(best_edge_node)
+        return self._best_edge
 
-    def _get_output_node(self, edge: 'MatchmakingEdge') -> 'MatchmakingTeam':
-        if edge.a.id == self.id:
-            return edge.b
-        return edge.a
+    def _get_best_candidate(self) -> int:
+        # teams are never unmatched between resets, so the cursor over the
+        # sorted opponents only moves forward; -1 when none is left
+        teams = self._graph.teams
+        neighbours = self._neighbours
+        index = self._candidate_index
+        while index < len(neighbours):
+            if teams[neighbours[index]]._best_edge is None:
+                self._candidate_index = index
+                return index
+            index += 1
+        self._candidate_index = index
+        return -1
 
     def set_best_edge(self, edge: 'MatchmakingEdge'):
+        if self._best_edge is None:
+            self._best_edge = edge
+            if self._state is not None:
+                self._state.remove_possible_edges(self._remaining_degree)
+            for opponent in self.iter_opponents():
+                opponent._remove_possible_edge()
         self._best_edge = edge
         self._is_searching = False
-
-    def reset(self):
+        if self._state is not None:
+            self._state.update_lonely_team(self)
+
+    def _remove_possible_edge(self):
+        self._remaining_degree -= 1
+        if self._state is None:
+            return
+        if not self.has_found_best_edge():
+            self._state.remove_possible_edges(1)
+        self._state.update_lonely_team(self)
+
+    def reset(self, state: 'MatchmakingState | None' = None):
         self._best_edge = None
         self._is_searching = False
+        self._candidate_index = 0
+        self._remaining_degree = len(self._neighbours)
+        self._state = state
 
     def search_lonely_edge(self) -> MatchmakingEdge | None:
-        best_edge: 'MatchmakingEdge | None' = None
-        best_edge_node: 'MatchMakingTeam | None' = None
-        for edge in self._edges:
-            node = self._get_output_node(edge)
-            if not node.is_lonely():
-                continue
-            if (best_edge is None
-                    or (edge.distance_points <= best_edge.distance_points
-                        and edge.past_matches_points <= best_edge.past_matches_points)):
-                best_edge = edge
-                best_edge_node = node
-        if best_edge is not None:
-            self.set_best_edge(best_edge)
-            best_edge_node.set_best_edge(best_edge)
-            return best_edge
+        # the first lonely opponent in the team's order is its best one
+        teams = self._graph.teams
+        for index, neighbour in enumerate(self._neighbours):
+            node = teams[neighbour]
+            if node.is_lonely() and not node.has_found_best_edge():
+                best_edge = self._graph.get_edge(self._edge_ids[index])
+                self.set_best_edge(best_edge)
+                node.set_best_edge(best_edge)
+                return best_edge
         return None
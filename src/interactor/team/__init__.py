@@ -3,11 +3,12 @@ author: oluiscabral
 date: 8/23/23
 """
 from abc import ABC
-from typing import Set, List
+from typing import Set, List, Dict, Iterable, Iterator
 
 from entity.match import Match
 from entity.matchup import Matchup
 from entity.team import Team
+from interactor.team.result import SaveMatchesResult
 
 
 class TeamInteractor(ABC):
@@ -15,7 +16,25 @@ class TeamInteractor(ABC):
     def create_teams(self, input_data) -> Set[Team]:
         pass
 
-    def save_matchups(self, matchups: List[Matchup]):
+    def iter_teams(self, input_data: Iterable[dict]) -> Iterator[Team]:
+        pass
+
+    def save_matchups(self, matchups: List[Matchup]) -> SaveMatchesResult:
+        pass
+
+    def iter_saved_matchups(self, matchups: Iterable[Matchup]) -> Iterator[Matchup]:
+        pass
+
+
+class TeamReader(ABC):
+
+    def read(self) -> Iterator[dict]:
+        pass
+
+
+class MatchupWriter(ABC):
+
+    def write(self, matchup: Matchup):
         pass
 
 
@@ -24,5 +43,11 @@ class TeamDatabase(ABC):
     def get_past_matches(self, team_id: str) -> List[Match]:
         pass
 
-    def save_matches(self, matches: List[Match]):
+    def get_past_matches_for_teams(self, team_ids: Iterable[str]) -> Dict[str, List[Match]]:
+        pass
+
+    def save_matches(self, matches: List[Match]) -> SaveMatchesResult:
+        pass
+
+    def iter_matches(self) -> Iterator[Match]:
         pass
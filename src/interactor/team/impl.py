@@ -2,11 +2,12 @@
 author: oluiscabral
 date: 8/23/23
 """
-import datetime
+import sys
 import uuid
-from typing import Set, List
+from collections import Counter
+from itertools import islice
+from typing import Set, List, Dict, Tuple, Iterable, Iterator
 
-from entity.availability import Availability
 from entity.city import City
 from entity.court import Court
 from entity.division import Division
@@ -14,7 +15,13 @@ from entity.match import Match
 from entity.matchup import Matchup
 from entity.player import Player
 from entity.team import Team
+from instrumentation.metrics import metrics
 from interactor.team import TeamInteractor, TeamDatabase
+from interactor.team.pipeline import Pipeline
+from interactor.team.result import SaveMatchesResult
+from interactor.team.slot import SlotParser
+
+CHUNK_SIZE = 1000
 
 
 class TeamInteractorImpl(TeamInteractor):
@@ -22,44 +29,77 @@ class TeamInteractorImpl(TeamInteractor):
     # noinspection PyTypeChecker
     def __init__(self):
         self._db: TeamDatabase = None
+        self._slots: SlotParser = SlotParser()
+        self._pipelined = False
 
     def set_db(self, db: TeamDatabase):
         self._db = db
 
+    def set_pipelined(self, pipelined: bool):
+        self._pipelined = pipelined
+
     def create_teams(self, input_data) -> Set[Team]:
-        teams = set()
-        for data in input_data:
-            team_id = data['team_id']
-            city = City(data['city'])
-            home_court = Court(data['Home Court'])
-            division = TeamInteractorImpl.get_division(data)
-            past_matches = self._db.get_past_matches(team_id)
-            availability = TeamInteractorImpl._create_availability(data)
-            player_1 = Player(data['player1_id'], data['player1_coords'])
-            player_2 = Player(data['player2_id'], data['player2_coords'])
-            team = Team(team_id, city, home_court, division, [player_1, player_2], past_matches, availability)
-            teams.add(team)
-        return teams
+        return set(self.iter_teams(input_data))
+
+    def iter_teams(self, input_data: Iterable[dict], chunk_size: int = CHUNK_SIZE) -> Iterator[Team]:
+        chunks = TeamInteractorImpl._iter_chunks(input_data, chunk_size)
+        if not self._pipelined:
+            for chunk in chunks:
+                yield from self._build_teams(self._fetch_past_matches(self._parse_teams(chunk)))
+            return
+        # parsing, history reads and team construction overlap, so loading
+        # takes about as long as the slowest of them instead of their sum
+        stages = (self._parse_teams, self._fetch_past_matches, self._build_teams)
+        for teams in Pipeline(chunks, stages):
+            yield from teams
+
+    @staticmethod
+    def _iter_chunks(input_data: Iterable, chunk_size: int) -> Iterator[list]:
+        records = iter(input_data)
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _parse_teams(self, input_data: List[dict]) -> List[tuple]:
+        parsed_teams = list()
+        with metrics.phase('parse_teams'):
+            for data in input_data:
+                team_id = sys.intern(data['team_id'])
+                city = City(sys.intern(data['city']))
+                home_court = Court(sys.intern(data['Home Court']))
+                division = TeamInteractorImpl.get_division(data)
+                availability = self._slots.parse_availability(data)
+                player_1 = Player(sys.intern(data['player1_id']), tuple(data['player1_coords']))
+                player_2 = Player(sys.intern(data['player2_id']), tuple(data['player2_coords']))
+                parsed_teams.append((team_id, city, home_court, division, (player_1, player_2), availability))
+        return parsed_teams
+
+    def _fetch_past_matches(self, parsed_teams: List[tuple]) -> Tuple[List[tuple], Dict[str, List[Match]]]:
+        return parsed_teams, self._db.get_past_matches_for_teams(parsed[0] for parsed in parsed_teams)
 
     @staticmethod
-    def _create_availability(data):
-        morning_dates = TeamInteractorImpl._create_dates(data['morning'])
-        afternoon_dates = TeamInteractorImpl._create_dates(data['afternoon'])
-        evening_dates = TeamInteractorImpl._create_dates(data['evening'])
-        return Availability(morning_dates, afternoon_dates, evening_dates)
+    def _build_teams(batch: Tuple[List[tuple], Dict[str, List[Match]]]) -> List[Team]:
+        parsed_teams, past_matches_by_team = batch
+        teams = list()
+        with metrics.phase('build_teams'):
+            for team_id, city, home_court, division, players, availability in parsed_teams:
+                past_matches = tuple(past_matches_by_team[team_id])
+                past_opponents = TeamInteractorImpl._count_opponents(team_id, past_matches)
+                teams.append(Team(team_id, city, home_court, division, players, past_matches, past_opponents,
+                                  availability))
+        metrics.increment('teams_created', len(teams))
+        return teams
 
     @staticmethod
-    def _create_dates(date_texts: Set[str]):
-        today = datetime.date.today()
-        dates = set()
-        for date_text in date_texts:
-            date_values_text = date_text.split(' ')[1]
-            date_value_texts = date_values_text.split('/')
-            day = int(date_value_texts[1])
-            month = int(date_value_texts[0])
-            created_date = datetime.date(month=month, day=day, year=today.year)
-            dates.add(created_date)
-        return dates
+    def _count_opponents(team_id: str, past_matches: Tuple[Match, ...]) -> Dict[str, int]:
+        opponents = Counter()
+        for match in past_matches:
+            for contestant in match.contestants:
+                if contestant != team_id:
+                    opponents[contestant] += 1
+        return opponents
 
     @staticmethod
     def get_division(data):
@@ -72,11 +112,18 @@ class TeamInteractorImpl(TeamInteractor):
             return Division.ADVANCED
         return None
 
-    def save_matchups(self, matchups: List[Matchup]):
+    def save_matchups(self, matchups: List[Matchup]) -> SaveMatchesResult:
         matches = list()
         for matchup in matchups:
             match_id = str(uuid.uuid4())
             team_a, team_b = matchup.contestants
             match = Match(match_id, matchup.availability, (team_a.id, team_b.id))
             matches.append(match)
-        self._db.save_matches(matches)
+        return self._db.save_matches(matches)
+
+    def iter_saved_matchups(self, matchups: Iterable[Matchup], chunk_size: int = CHUNK_SIZE) -> Iterator[Matchup]:
+        # each chunk is saved before it is handed on, so a matchup is only
+        # written out once it is part of the match history
+        for chunk in TeamInteractorImpl._iter_chunks(matchups, chunk_size):
+            self.save_matchups(chunk)
+            yield from chunk
@@ -0,0 +1,85 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, List, Sequence
+
+QUEUE_SIZE = 4
+POLL_SECONDS = 0.1
+
+_DONE = object()
+
+
+class _Failure:
+    __slots__ = ('error',)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class Pipeline:
+    # every stage runs on its own thread and hands its results to the next
+    # one through a bounded queue, so a slow stage applies back pressure
+    # instead of letting the others buffer the whole input
+
+    def __init__(self, source: Iterable, stages: Sequence[Callable], queue_size: int = QUEUE_SIZE):
+        self._source = source
+        self._stages = tuple(stages)
+        self._queue_size = queue_size
+        self._stopped = threading.Event()
+
+    def __iter__(self) -> Iterator:
+        queues = [queue.Queue(self._queue_size) for _ in self._stages]
+        threads: List[threading.Thread] = list()
+        items = self._source
+        for stage, output in zip(self._stages, queues):
+            thread = threading.Thread(target=self._run, args=(items, stage, output), daemon=True)
+            threads.append(thread)
+            items = self._drain(output)
+        self._stopped.clear()
+        for thread in threads:
+            thread.start()
+        try:
+            yield from items
+        finally:
+            self._stopped.set()
+            for thread in threads:
+                thread.join()
+
+    def _run(self, items: Iterable, stage: Callable, output: queue.Queue):
+        try:
+            for item in items:
+                if not self._put(output, stage(item)):
+                    return
+        except BaseException as error:
+            self._put(output, _Failure(error))
+            return
+        self._put(output, _DONE)
+
+    def _drain(self, source: queue.Queue) -> Iterator:
+        while True:
+            item = self._get(source)
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+
+    def _put(self, target: queue.Queue, item) -> bool:
+        while not self._stopped.is_set():
+            try:
+                target.put(item, timeout=POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue):
+        while not self._stopped.is_set():
+            try:
+                return source.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _DONE
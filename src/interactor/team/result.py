@@ -0,0 +1,12 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SaveMatchesResult:
+    matches: int
+    availabilities: int
+    elapsed: float
@@ -0,0 +1,39 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import datetime
+from functools import lru_cache
+
+from entity.availability import Availability, PERIODS
+
+SLOT_FIELDS = ('morning', 'afternoon', 'evening')
+CACHE_SIZE = 1024
+
+
+class SlotParser:
+
+    def __init__(self, year: int = None, cache_size: int = CACHE_SIZE):
+        if year is None:
+            year = datetime.date.today().year
+        first_day = datetime.date(year, 1, 1)
+        self._year = year
+        self._epoch = first_day - datetime.timedelta(days=first_day.weekday())
+        self._get_offset = lru_cache(maxsize=cache_size)(self._parse_offset)
+
+    @property
+    def year(self) -> int:
+        return self._year
+
+    def parse_availability(self, data) -> Availability:
+        mask = 0
+        for period, field in enumerate(SLOT_FIELDS):
+            for label in data[field]:
+                mask |= 1 << (self._get_offset(label) + period)
+        return Availability(mask, self._epoch)
+
+    def _parse_offset(self, label: str) -> int:
+        # labels look like 'Saturday 8/26'; the weekday is implied by the date
+        month, day = label.split(' ')[1].split('/')
+        date = datetime.date(month=int(month), day=int(day), year=self._year)
+        return (date - self._epoch).days * PERIODS
@@ -0,0 +1,139 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import csv
+import datetime
+import json
+import sys
+from typing import Iterator, TextIO, Dict, Tuple, Set
+
+from entity.division import Division
+from interactor.team import TeamReader
+
+TEXT_FIELDS = ('team_id', 'player1_id', 'player2_id', 'city', 'division', 'Home Court')
+COORDINATES_FIELDS = ('player1_coords', 'player2_coords')
+SLOT_FIELDS = ('morning', 'afternoon', 'evening')
+DIVISIONS = {division.name.lower() for division in Division}
+# slots carry no year, so dates are checked against a leap year to let 2/29 through
+LEAP_YEAR = 2024
+
+
+class InvalidRecordError(ValueError):
+    pass
+
+
+class StreamTeamReader(TeamReader):
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+
+    def __enter__(self) -> 'StreamTeamReader':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._stream is not sys.stdin:
+            self._stream.close()
+
+    def read(self) -> Iterator[dict]:
+        for line_number, raw_record in self._read_raw_records():
+            yield StreamTeamReader._parse_record(line_number, raw_record)
+
+    def _read_raw_records(self) -> Iterator[Tuple[int, dict]]:
+        pass
+
+    @staticmethod
+    def _parse_record(line_number: int, raw_record: dict) -> dict:
+        if not isinstance(raw_record, dict):
+            raise InvalidRecordError(f'line {line_number}: expected a team record')
+        record = dict()
+        for field in TEXT_FIELDS:
+            value = raw_record.get(field)
+            if not isinstance(value, str) or not value:
+                raise InvalidRecordError(f'line {line_number}: missing {field}')
+            record[field] = value
+        if record['division'].lower() not in DIVISIONS:
+            raise InvalidRecordError(f"line {line_number}: unknown division {record['division']}")
+        for field in COORDINATES_FIELDS:
+            record[field] = StreamTeamReader._parse_coordinates(line_number, field, raw_record.get(field))
+        for field in SLOT_FIELDS:
+            record[field] = StreamTeamReader._parse_slots(line_number, field, raw_record.get(field))
+        return record
+
+    @staticmethod
+    def _parse_coordinates(line_number: int, field: str, value) -> Tuple[str, str]:
+        if isinstance(value, str):
+            value = value.split(',')
+        if not isinstance(value, (list, tuple)) or len(value) != 2:
+            raise InvalidRecordError(f'line {line_number}: {field} must hold a latitude and a longitude')
+        try:
+            latitude, longitude = (float(coordinate) for coordinate in value)
+        except (TypeError, ValueError):
+            raise InvalidRecordError(f'line {line_number}: {field} must be numeric') from None
+        if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+            raise InvalidRecordError(f'line {line_number}: {field} is out of range')
+        return str(value[0]).strip(), str(value[1]).strip()
+
+    @staticmethod
+    def _parse_slots(line_number: int, field: str, value) -> Set[str]:
+        if value is None:
+            return set()
+        if isinstance(value, str):
+            value = [slot for slot in value.split(';') if slot.strip()]
+        if not isinstance(value, (list, tuple, set)):
+            raise InvalidRecordError(f'line {line_number}: {field} must be a list of slots')
+        slots = set()
+        for slot in value:
+            if not isinstance(slot, str) or not StreamTeamReader._is_slot(slot.strip()):
+                raise InvalidRecordError(f"line {line_number}: {field} slot {slot!r} is not like 'Saturday 8/26'")
+            slots.add(slot.strip())
+        return slots
+
+    @staticmethod
+    def _is_slot(slot: str) -> bool:
+        parts = slot.split(' ')
+        if len(parts) != 2 or len(parts[1].split('/')) != 2:
+            return False
+        try:
+            month, day = (int(number) for number in parts[1].split('/'))
+            datetime.date(LEAP_YEAR, month, day)
+        except ValueError:
+            return False
+        return True
+
+
+class JsonLinesTeamReader(StreamTeamReader):
+    # one JSON object per line, with the same fields as sample.input_data;
+    # coordinates and slots are JSON arrays
+
+    def _read_raw_records(self) -> Iterator[Tuple[int, dict]]:
+        for line_number, line in enumerate(self._stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as error:
+                raise InvalidRecordError(f'line {line_number}: {error.msg}') from None
+
+
+class CsvTeamReader(StreamTeamReader):
+    # a header row with the sample.input_data field names; coordinates are
+    # written as 'latitude,longitude' and slots are separated by ';'
+
+    def _read_raw_records(self) -> Iterator[Tuple[int, Dict[str, str]]]:
+        reader = csv.DictReader(self._stream)
+        for raw_record in reader:
+            yield reader.line_num, raw_record
+
+
+def open_team_reader(path: str, file_format: str = None) -> StreamTeamReader:
+    if file_format is None:
+        file_format = 'csv' if path.lower().endswith('.csv') else 'jsonl'
+    stream = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')
+    if file_format == 'csv':
+        return CsvTeamReader(stream)
+    if file_format == 'jsonl':
+        return JsonLinesTeamReader(stream)
+    if stream is not sys.stdin:
+        stream.close()
+    raise ValueError(f'unknown team file format {file_format}')
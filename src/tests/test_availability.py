@@ -0,0 +1,77 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import datetime
+import random
+import unittest
+from typing import Set, Tuple
+
+from entity.availability import Availability, PERIODS
+
+FIRST_DATE = datetime.date(2026, 8, 19)
+
+
+def get_random_slots(rng: random.Random) -> Set[Tuple[datetime.date, int]]:
+    # spread over several weeks, so epochs and masks of different widths meet
+    start = FIRST_DATE + datetime.timedelta(days=rng.randrange(28))
+    return {(start + datetime.timedelta(days=rng.randrange(21)), rng.randrange(PERIODS))
+            for _ in range(rng.randrange(6))}
+
+
+class AvailabilityTest(unittest.TestCase):
+
+    def test_dates_round_trip(self):
+        morning = {datetime.date(2026, 8, 26), datetime.date(2026, 9, 6)}
+        afternoon = set()
+        evening = {datetime.date(2026, 8, 26)}
+        availability = Availability.from_dates(morning, afternoon, evening)
+        self.assertEqual(morning, availability.morning)
+        self.assertEqual(afternoon, availability.afternoon)
+        self.assertEqual(evening, availability.evening)
+        self.assertEqual(datetime.date(2026, 8, 24), availability.epoch)
+
+    def test_slots_round_trip(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            slots = get_random_slots(rng)
+            availability = Availability.from_slots(slots)
+            self.assertEqual(sorted(slots), list(availability.slots()))
+            self.assertEqual(availability, Availability.from_slots(availability.slots()))
+
+    def test_meets_and_intersection_match_sets(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            slots, other_slots = get_random_slots(rng), get_random_slots(rng)
+            availability, other = Availability.from_slots(slots), Availability.from_slots(other_slots)
+            self.assertEqual(bool(slots & other_slots), availability.meets(other))
+            self.assertEqual(bool(slots & other_slots), other.meets(availability))
+            self.assertEqual(sorted(slots & other_slots), list(availability.get_intersection(other).slots()))
+            self.assertEqual(availability.get_intersection(other), other.get_intersection(availability))
+
+    def test_equal_availabilities_from_different_epochs(self):
+        # the same saturday morning, counted from its own monday and from
+        # mondays one and five weeks earlier
+        saturday_morning = 5 * PERIODS
+        epoch = datetime.date(2026, 8, 24)
+        availabilities = [Availability(1 << (saturday_morning + weeks * 7 * PERIODS),
+                                       epoch - datetime.timedelta(weeks=weeks))
+                          for weeks in (0, 1, 5)]
+        availabilities.append(Availability.from_slots([(datetime.date(2026, 8, 29), 0)]))
+        for availability in availabilities:
+            self.assertEqual(availabilities[0], availability)
+            self.assertEqual(hash(availabilities[0]), hash(availability))
+        self.assertEqual(1, len(set(availabilities)))
+
+    def test_empty(self):
+        empty = Availability.from_slots([])
+        self.assertEqual(empty, Availability(0, FIRST_DATE))
+        self.assertEqual(hash(empty), hash(Availability(0, FIRST_DATE)))
+        self.assertEqual([], list(empty.slots()))
+        other = Availability.from_slots([(FIRST_DATE, 0)])
+        self.assertFalse(empty.meets(other))
+        self.assertEqual(empty, empty.get_intersection(other))
+
+
+if __name__ == '__main__':
+    unittest.main()
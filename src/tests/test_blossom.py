@@ -0,0 +1,77 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import random
+import unittest
+from typing import List, Tuple
+
+from entity.team import Team
+from interactor.matchmaking.graph import MatchmakingGraph, REMATCH_PENALTY
+from interactor.matchmaking.solver.blossom import BlossomMatchmakingSolver
+from interactor.matchmaking.solver.greedy import GreedyMatchmakingSolver
+from interactor.matchmaking.team import MatchmakingTeam
+from tests.test_greedy import create_team, get_pairs
+
+
+def create_league(rng: random.Random, size: int) -> List[Team]:
+    ids = [f't{index}' for index in range(size)]
+    past_opponents = {team_id: dict() for team_id in ids}
+    for team_a, team_b in (rng.sample(ids, 2) for _ in range(size // 2)):
+        past_opponents[team_a][team_b] = past_opponents[team_b][team_a] = 1
+    return [create_team(team_id, rng.sample([21, 22, 23, 24], rng.randint(1, 2)), f'{rng.uniform(35, 36):.4f}',
+                        past_opponents[team_id])
+            for team_id in ids]
+
+
+def get_graph(teams: List[Team]) -> MatchmakingGraph:
+    return MatchmakingGraph([MatchmakingTeam(team) for team in teams])
+
+
+def get_best_value(graph: MatchmakingGraph) -> Tuple[int, float]:
+    # the most matchups first, then the lowest total cost, by trying every matching
+    edges = list(zip(graph.sources.tolist(), graph.targets.tolist(), graph.costs.tolist()))
+    best = (0, 0.0)
+    stack = [(0, frozenset(), 0, 0.0)]
+    while stack:
+        start, used, matchups, cost = stack.pop()
+        if matchups > best[0] or (matchups == best[0] and cost < best[1]):
+            best = (matchups, cost)
+        for k in range(start, len(edges)):
+            i, j, edge_cost = edges[k]
+            if i not in used and j not in used:
+                stack.append((k + 1, used | {i, j}, matchups + 1, cost + edge_cost))
+    return best
+
+
+class BlossomMatchmakingSolverTest(unittest.TestCase):
+
+    def test_minimum_cost_among_maximum_matchings(self):
+        rng = random.Random(0)
+        for _ in range(150):
+            graph = get_graph(create_league(rng, rng.randint(2, 10)))
+            result = BlossomMatchmakingSolver().solve(graph)
+            matchups, cost = get_best_value(graph)
+            self.assertEqual(matchups, len(result.matchups))
+            self.assertEqual(len(graph.teams) - 2 * matchups, result.byes)
+            # weights are rounded to hundredths of a point
+            self.assertAlmostEqual(cost, result.distance_points + REMATCH_PENALTY * result.past_matches_points,
+                                   delta=0.01 * max(1, matchups))
+
+    def test_no_more_byes_than_greedy(self):
+        rng = random.Random(1)
+        for _ in range(50):
+            teams = create_league(rng, rng.randint(10, 40))
+            blossom_result = BlossomMatchmakingSolver().solve(get_graph(teams))
+            greedy_result = GreedyMatchmakingSolver().solve(get_graph(teams))
+            self.assertLessEqual(blossom_result.byes, greedy_result.byes)
+
+    def test_large_components_fall_back_to_greedy(self):
+        teams = create_league(random.Random(2), 12)
+        blossom_result = BlossomMatchmakingSolver(max_teams=4).solve(get_graph(teams))
+        greedy_result = GreedyMatchmakingSolver().solve(get_graph(teams))
+        self.assertEqual(get_pairs(greedy_result), get_pairs(blossom_result))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import datetime
+import unittest
+from typing import Dict, List
+
+from entity.availability import Availability
+from entity.city import City
+from entity.court import Court
+from entity.division import Division
+from entity.player import Player
+from entity.team import Team
+from interactor.matchmaking.impl import MatchmakingImpl
+
+
+def create_team(team_id: str, days: List[int], latitude: str = '35.0', past_opponents: Dict[str, int] = None) -> Team:
+    availability = Availability.from_dates([datetime.date(2026, 8, day) for day in days], [], [])
+    players = (Player(f'{team_id}1', (latitude, '-78.0')), Player(f'{team_id}2', (latitude, '-78.0')))
+    return Team(team_id, City('New York'), Court('Court A'), Division.BEGINNER, players, (), past_opponents or {},
+                availability)
+
+
+def get_pairs(result) -> List[tuple]:
+    return sorted(tuple(sorted(team.id for team in matchup.contestants)) for matchup in result.matchups)
+
+
+class GreedyMatchmakingSolverTest(unittest.TestCase):
+
+    def test_lonely_pass_matchups_are_kept(self):
+        # a - b - c is a path whose only matchup comes from the lonely pass,
+        # which uses up every edge of the component; a and c tie for b
+        teams = [create_team('tA', [21]), create_team('tB', [21, 22]), create_team('tC', [22]),
+                 create_team('tD', [25]), create_team('tE', [25])]
+        result = MatchmakingImpl().get_best_result(teams)
+        pairs = get_pairs(result)
+        self.assertEqual(2, len(pairs))
+        self.assertIn(('tD', 'tE'), pairs)
+        self.assertIn(pairs[0], [('tA', 'tB'), ('tB', 'tC')])
+        self.assertEqual(1, result.byes)
+
+    def test_three_team_path_alone(self):
+        teams = [create_team('tA', [21]), create_team('tB', [21, 22]), create_team('tC', [22])]
+        result = MatchmakingImpl().get_best_result(teams)
+        pairs = get_pairs(result)
+        self.assertEqual(1, len(pairs))
+        self.assertIn(pairs[0], [('tA', 'tB'), ('tB', 'tC')])
+        self.assertEqual(1, result.byes)
+
+    def test_teams_are_matched_at_most_once(self):
+        # b is the only opponent of both a and c, and d is lonely next to c
+        teams = [create_team('tA', [21]), create_team('tB', [21, 22]), create_team('tC', [22, 23]),
+                 create_team('tD', [23])]
+        result = MatchmakingImpl().get_best_result(teams)
+        contestants = [team.id for matchup in result.matchups for team in matchup.contestants]
+        self.assertEqual(len(contestants), len(set(contestants)))
+        self.assertEqual(len(teams), len(contestants) + result.byes)
+
+    def test_rematch_outweighs_a_slightly_shorter_trip(self):
+        # b and c are both lonely next to a; b is nearer but a played it before
+        teams = [create_team('tA', [21, 22], '35.00', {'tB': 1}), create_team('tB', [21], '35.01', {'tA': 1}),
+                 create_team('tC', [22], '35.02')]
+        result = MatchmakingImpl().get_best_result(teams)
+        self.assertEqual([('tA', 'tC')], get_pairs(result))
+        self.assertEqual(0, result.past_matches_points)
+
+
+if __name__ == '__main__':
+    unittest.main()
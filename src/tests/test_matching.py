@@ -0,0 +1,62 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import random
+import unittest
+from itertools import combinations
+from typing import List, Tuple
+
+from interactor.matchmaking.solver.matching import Edge, MaximumWeightMatching
+
+
+def get_best_value(edges: List[Edge], max_cardinality: bool) -> Tuple[int, int]:
+    # every matching, as (cardinality, weight) or (0, weight)
+    best = (0, 0)
+    stack = [(0, frozenset(), 0, 0)]
+    while stack:
+        start, used, cardinality, weight = stack.pop()
+        best = max(best, (cardinality if max_cardinality else 0, weight))
+        for k in range(start, len(edges)):
+            i, j, edge_weight = edges[k]
+            if i not in used and j not in used:
+                stack.append((k + 1, used | {i, j}, cardinality + 1, weight + edge_weight))
+    return best
+
+
+def get_value(mate: List[int], edges: List[Edge], max_cardinality: bool) -> Tuple[int, int]:
+    matched = [(i, j, weight) for i, j, weight in edges if mate[i] == j]
+    return len(matched) if max_cardinality else 0, sum(weight for _, _, weight in matched)
+
+
+class MaximumWeightMatchingTest(unittest.TestCase):
+
+    def _check_random_graphs(self, max_cardinality: bool, max_weight: int, seed: int):
+        rng = random.Random(seed)
+        for _ in range(500):
+            vertices = rng.randint(1, 9)
+            edges = [(i, j, rng.randint(1, max_weight)) for i, j in combinations(range(vertices), 2)
+                     if rng.random() < 0.5]
+            mate = MaximumWeightMatching.from_edges(vertices, edges, max_cardinality).solve()
+            for v, w in enumerate(mate):
+                if w >= 0:
+                    self.assertEqual(v, mate[w])
+            self.assertEqual(get_best_value(edges, max_cardinality), get_value(mate, edges, max_cardinality),
+                             (vertices, edges))
+
+    def test_maximum_cardinality_matches_brute_force(self):
+        self._check_random_graphs(True, 20, 0)
+
+    def test_maximum_weight_matches_brute_force(self):
+        self._check_random_graphs(False, 20, 1)
+
+    def test_tied_weights_match_brute_force(self):
+        # few distinct weights create many tight edges and nested blossoms
+        self._check_random_graphs(True, 3, 2)
+
+    def test_no_edges(self):
+        self.assertEqual([-1, -1, -1], MaximumWeightMatching.from_edges(3, []).solve())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import io
+import json
+import unittest
+
+from reader.team import InvalidRecordError, JsonLinesTeamReader
+
+RECORD = {'team_id': 'tA', 'player1_id': 'p1', 'player2_id': 'p2', 'player1_coords': ['35.7', '-78.7'],
+          'player2_coords': ['35.5', '-78.7'], 'city': 'New York', 'division': 'Intermediate',
+          'Home Court': 'Court A', 'morning': ['Saturday 8/26'], 'afternoon': [], 'evening': []}
+
+
+def read(*records: dict) -> list:
+    stream = io.StringIO(''.join(json.dumps(record) + '\n' for record in records))
+    return list(JsonLinesTeamReader(stream).read())
+
+
+class JsonLinesTeamReaderTest(unittest.TestCase):
+
+    def test_valid_slots(self):
+        record = read(dict(RECORD, morning=['Saturday 8/26', 'Thursday 2/29']))[0]
+        self.assertEqual({'Saturday 8/26', 'Thursday 2/29'}, record['morning'])
+
+    def test_invalid_dates_name_their_line(self):
+        for label in ('Saturday 13/40', 'Saturday x/1', 'Saturday 4/31', 'Saturday 8/26/2026', 'Saturday'):
+            with self.assertRaisesRegex(InvalidRecordError, f'^line 2: evening slot {label!r}'):
+                read(RECORD, dict(RECORD, evening=[label]))
+
+    def test_invalid_json_names_its_line(self):
+        stream = io.StringIO(json.dumps(RECORD) + '\n{\n')
+        with self.assertRaisesRegex(InvalidRecordError, '^line 2: '):
+            list(JsonLinesTeamReader(stream).read())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from database.schema import Schema
+from database.team import TeamDatabaseImpl
+
+
+class TeamDatabaseTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.db_file_path = os.path.join(directory.name, 'team.db')
+        self.db = TeamDatabaseImpl(self.db_file_path)
+        self.db.__enter__()
+        self.addCleanup(self.db.__exit__, None, None, None)
+        conn = self.db._get_connection()
+        with conn:
+            conn.execute("INSERT INTO match (id, team_a, team_b) VALUES ('m1', 'tA', 'tB')")
+            conn.execute("INSERT INTO availability (date, match, period) VALUES ('2026-13-01', 'm1', 0)")
+
+    def test_failed_load_does_not_break_later_loads(self):
+        with self.assertRaises(ValueError):
+            self.db.get_past_matches_for_teams(['tA'])
+        conn = self.db._get_connection()
+        with conn:
+            conn.execute("UPDATE availability SET date = '2026-08-01' WHERE match = 'm1'")
+        past_matches = self.db.get_past_matches_for_teams(['tA', 'tC'])
+        self.assertEqual([match.id for match in past_matches['tA']], ['m1'])
+        self.assertEqual(past_matches['tC'], [])
+
+    def test_current_schema_is_not_rewritten(self):
+        # data_version changes when another connection commits to the file
+        observer = sqlite3.connect(self.db_file_path)
+        self.addCleanup(observer.close)
+        data_version = observer.execute('PRAGMA data_version').fetchone()[0]
+        self.assertEqual(Schema.get_latest_version(), Schema.migrate(self.db._get_connection()))
+        self.assertEqual(data_version, observer.execute('PRAGMA data_version').fetchone()[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
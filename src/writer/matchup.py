@@ -0,0 +1,88 @@
+"""
+author: oluiscabral
+date: 10/18/26
+"""
+import csv
+import json
+import sys
+from typing import Iterable, List, TextIO
+
+from entity.availability import PERIODS
+from entity.matchup import Matchup
+from interactor.team import MatchupWriter
+
+FIELDS = ('team1', 'team2', 'Reccomended Day/Times')
+WEEK_DAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+PERIOD_NAMES = ('Morning', 'Afternoon', 'Evening')
+# one label per slot of the week, indexed like Availability.slot_indexes()
+SLOT_LABELS = tuple(f'{day} {period}' for day in WEEK_DAYS for period in PERIOD_NAMES)
+WEEK_SLOTS = len(WEEK_DAYS) * PERIODS
+
+
+class StreamMatchupWriter(MatchupWriter):
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._written = 0
+
+    def __enter__(self) -> 'StreamMatchupWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._stream is sys.stdout:
+            self._stream.flush()
+        else:
+            self._stream.close()
+
+    @property
+    def written(self) -> int:
+        return self._written
+
+    def write(self, matchup: Matchup):
+        team_a, team_b = matchup.contestants
+        self._write_row(team_a.id, team_b.id, StreamMatchupWriter.get_labels(matchup))
+        self._written += 1
+
+    def write_all(self, matchups: Iterable[Matchup]) -> int:
+        for matchup in matchups:
+            self.write(matchup)
+        return self._written
+
+    @staticmethod
+    def get_labels(matchup: Matchup) -> List[str]:
+        return [SLOT_LABELS[index % WEEK_SLOTS] for index in matchup.availability.slot_indexes()]
+
+    def _write_row(self, team_a: str, team_b: str, labels: List[str]):
+        pass
+
+
+class JsonLinesMatchupWriter(StreamMatchupWriter):
+
+    def _write_row(self, team_a: str, team_b: str, labels: List[str]):
+        self._stream.write(json.dumps(dict(zip(FIELDS, (team_a, team_b, labels)))))
+        self._stream.write('\n')
+
+
+class CsvMatchupWriter(StreamMatchupWriter):
+    # the same columns as the json lines output; labels are separated by ';'
+
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self._writer = csv.writer(stream)
+        self._writer.writerow(FIELDS)
+
+    def _write_row(self, team_a: str, team_b: str, labels: List[str]):
+        self._writer.writerow((team_a, team_b, ';'.join(labels)))
+
+
+def open_matchup_writer(path: str = None, file_format: str = None) -> StreamMatchupWriter:
+    if file_format is None:
+        file_format = 'csv' if path is not None and path.lower().endswith('.csv') else 'jsonl'
+    stream = sys.stdout if path is None or path == '-' else open(path, 'w', newline='', encoding='utf-8')
+    if file_format == 'csv':
+        return CsvMatchupWriter(stream)
+    if file_format == 'jsonl':
+        return JsonLinesMatchupWriter(stream)
+    if stream is not sys.stdout:
+        stream.close()
+    raise ValueError(f'unknown matchup file format {file_format}')